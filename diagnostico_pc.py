@@ -15,18 +15,31 @@ import sys
 import time
 import datetime
 import threading
+import atexit
 import json
 import csv
+import itertools
+import functools
 import subprocess
 import platform
+import socket
 import ctypes
+import hashlib
+import html
+import tempfile
+import importlib
+import importlib.util
+from array import array
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from string import Template
 
 # Verificar se está rodando como administrador
 def is_admin():
     try:
         return ctypes.windll.shell32.IsUserAnAdmin()
-    except:
+    except (AttributeError, OSError):  # windll só existe no Windows
         return False
 
 if not is_admin():
@@ -34,64 +47,69 @@ if not is_admin():
     print("   Clique com botão direito no prompt e 'Executar como administrador'")
     print("   Continuando sem privilégios completos...\n")
 
-# Lista de dependências necessárias
-DEPENDENCIES = [
-    "psutil",
-    "GPUtil", 
-    "py-cpuinfo",
-    "tabulate",
-    "rich",
-    "matplotlib",
-    "wmi"
-]
+# Lista de dependências necessárias (pacote pip -> módulo importado)
+DEPENDENCIES = {
+    "psutil": "psutil",
+    "GPUtil": "GPUtil", 
+    "py-cpuinfo": "cpuinfo",
+    "tabulate": "tabulate",
+    "rich": "rich",
+    "matplotlib": "matplotlib",
+    "wmi": "wmi",
+    "nvidia-ml-py": "pynvml"
+}
 
 print("🔧 SISTEMA DE DIAGNÓSTICO DE PC v1.0")
 print("=" * 50)
 print("📋 Verificando dependências necessárias...\n")
 
-# Verificar e importar bibliotecas com fallback
+# Verificar bibliotecas com fallback (sem importá-las ainda)
 missing_deps = []
 available_libs = {}
 
 # Importações padrão
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
-import threading
 
 # Verificar dependências opcionais
-for dep in DEPENDENCIES:
-    try:
-        if dep == "psutil":
-            import psutil
-            available_libs['psutil'] = True
-        elif dep == "GPUtil":
-            import GPUtil
-            available_libs['GPUtil'] = True
-        elif dep == "py-cpuinfo":
-            import cpuinfo
-            available_libs['cpuinfo'] = True
-        elif dep == "tabulate":
-            from tabulate import tabulate
-            available_libs['tabulate'] = True
-        elif dep == "rich":
-            from rich.console import Console
-            from rich.table import Table
-            from rich.panel import Panel
-            available_libs['rich'] = True
-        elif dep == "matplotlib":
-            import matplotlib.pyplot as plt
-            import matplotlib.dates as mdates
-            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-            available_libs['matplotlib'] = True
-        elif dep == "wmi":
-            import wmi
-            available_libs['wmi'] = True
+for dep, module_name in DEPENDENCIES.items():
+    available_libs[module_name] = importlib.util.find_spec(module_name) is not None
+    if available_libs[module_name]:
         print(f"✅ {dep}: OK")
-    except ImportError:
+    else:
         missing_deps.append(dep)
-        available_libs[dep.replace('-', '_')] = False
         print(f"❌ {dep}: NÃO INSTALADO")
 
+# psutil é leve e usado em quase todas as funções
+if available_libs['psutil']:
+    import psutil
+
+# Nomes das famílias de endereço de rede
+ADDRESS_FAMILIES = {socket.AF_INET: 'IPv4', socket.AF_INET6: 'IPv6'}
+if available_libs['psutil']:
+    ADDRESS_FAMILIES[psutil.AF_LINK] = 'MAC'
+
+# Módulos pesados (cpuinfo, GPUtil, pynvml, wmi, matplotlib) são importados no primeiro uso
+_modules = {}
+
+def _lazy(name):
+    """Importa um módulo sob demanda e mantém em cache.
+    
+    find_spec só garante que o pacote existe; se a importação falhar (ex.: GPUtil
+    sem distutils no Python 3.12+), a biblioteca é marcada como indisponível
+    e o ImportError é repassado ao chamador.
+    """
+    module = _modules.get(name)
+    if module is None:
+        try:
+            module = _modules[name] = importlib.import_module(name)
+        except ImportError:
+            root = name.partition('.')[0]
+            # pythoncom e pywintypes vêm do pywin32, instalado junto com o wmi
+            available_libs['wmi' if root in ('pythoncom', 'pywintypes') else root] = False
+            raise
+    return module
+
 if missing_deps:
     print(f"\n⚠️  Dependências faltando: {', '.join(missing_deps)}")
     print("📥 Para instalar todas as dependências:")
@@ -100,33 +118,432 @@ if missing_deps:
 else:
     print("\n✅ Todas as dependências estão instaladas!\n")
 
+def _wmi_errors():
+    """Tipos de exceção levantados pelas consultas WMI/COM"""
+    return (_lazy('wmi').x_wmi, _lazy('pywintypes').com_error)
+
+# Dados invariantes do sistema, consultados uma única vez (platform.processor()
+# e platform.version() podem disparar subprocessos)
+_SYS_INFO = {
+    "sistema": platform.system(),
+    "versao": platform.version(),
+    "release": platform.release(),
+    "arquitetura": platform.architecture()[0],
+    "processador": platform.processor(),
+    "maquina": platform.machine(),
+    "no_computador": platform.node()
+}
+
+# Cache em disco dos dados do py-cpuinfo entre execuções
+CPUINFO_CACHE_FILE = Path(tempfile.gettempdir()) / "diag_cpuinfo.json"
+
+# Fatores de conversão de bytes para GB e MB
+_GIB = 1.0 / 1073741824
+_MIB = 1.0 / 1048576
+
+# Códigos SMBIOS de tipo de memória (Win32_PhysicalMemory.SMBIOSMemoryType)
+SMBIOS_MEMORY_TYPES = {
+    18: 'DDR', 19: 'DDR2', 20: 'DDR2 FB-DIMM', 24: 'DDR3', 26: 'DDR4',
+    27: 'LPDDR', 28: 'LPDDR2', 29: 'LPDDR3', 30: 'LPDDR4', 34: 'DDR5', 35: 'LPDDR5'
+}
+
+# Tipos de unidade retornados por GetDriveTypeW
+DRIVE_FIXED = 3
+DRIVE_RAMDISK = 6
+
+# Intervalo de amostragem do uso de CPU em segundo plano (ms)
+CPU_SAMPLE_MS = 500
+
+# Buffer de escrita dos arquivos exportados (relatórios, logs e CSV)
+EXPORT_BUFFER = 1 << 16
+
+# Arquivos gerados pela ferramenta removidos por "Limpar Logs": (prefixo, extensão)
+CLEANUP_PATTERNS = (('', '.log'), ('monitoramento_pc_', '.csv'),
+                    ('relatorio_pc_', '.txt'), ('relatorio_pc_', '.html'))
+
+# Formato numérico das colunas exportadas em CSV
+CSV_FLOAT_FMT = '{:.2f}'
+
+# Capacidade inicial dos buffers de monitoramento: 30 min com uma amostra a cada 2 s
+MONITORING_INTERVAL = 2
+MAX_SAMPLES = 30 * 60 // MONITORING_INTERVAL + 16
+
+# Extensões do conjunto de instruções mostradas no relatório do CPU: rótulo -> grafias
+# aceitas (py-cpuinfo usa os nomes do /proc no Linux e os do CPUID no Windows)
+INTERESTING_FLAGS = {
+    'sse4_2': ('sse4_2',),
+    'avx': ('avx',),
+    'avx2': ('avx2',),
+    'avx512f': ('avx512f',),
+    'avx512_vnni': ('avx512_vnni', 'avx512vnni'),
+    'aes': ('aes',),
+    'sha_ni': ('sha_ni', 'sha')
+}
+
+# Limites de temperatura (°C) e índices de acesso
+CPU_W, CPU_C, GPU_W, GPU_C, DISK_W, DISK_C = range(6)
+TEMP_LIMITS = (75, 85, 80, 90, 50, 60)
+
+# Modelos das mensagens de alerta de temperatura
+MSG_TEMP_CRITICAL = 'Temperatura crítica: {:.1f}°C (limite: {}°C)'
+MSG_TEMP_HIGH = 'Temperatura alta: {:.1f}°C (limite recomendado: {}°C)'
+
+# Sensores de temperatura da CPU (Intel, AMD e genéricos) e validade da leitura (s)
+CPU_SENSOR_HINTS = ('coretemp', 'k10temp', 'cpu')
+TEMP_CACHE_S = 5
+
+# Ordem de exibição das prioridades das recomendações
+REC_PRIORITIES = ('CRÍTICA', 'ALTA', 'MÉDIA', 'BAIXA')
+
+# Regras de recomendação: (seção, valor bruto, limite, categoria, prioridade,
+# componente, problema, recomendação)
+HEALTH_RULES = (
+    ('cpu', 'uso_atual_raw', 80, 'Performance', 'ALTA', 'CPU', 'Uso alto de CPU: {:.1f}%',
+     'Feche programas desnecessários, verifique processos em segundo plano, considere upgrade do processador'),
+    ('gpu', 'uso_gpu_raw', 90, 'Performance', 'MÉDIA', 'GPU', 'Uso alto de GPU: {:.1f}%',
+     'Reduza configurações gráficas em jogos/aplicações, verifique drivers atualizados'),
+    ('memoria', 'porcentagem_uso_raw', 85, 'Hardware', 'ALTA', 'RAM', 'Uso alto de memória: {:.1f}%',
+     'Considere adicionar mais RAM, feche aplicações não utilizadas, verifique vazamentos de memória'),
+)
+
+# Regras de espaço em disco: (limite, prioridade, problema, recomendação)
+STORAGE_RULES = (
+    (90, 'CRÍTICA', 'Espaço crítico em {}: {:.1f}%',
+     'Libere espaço urgentemente, mova arquivos para disco externo, execute limpeza de disco'),
+    (80, 'MÉDIA', 'Espaço baixo em {}: {:.1f}%',
+     'Execute limpeza de arquivos temporários, desinstale programas não utilizados'),
+)
+
+# Repetição de eventos no log do monitoramento: intervalo mínimo (s) e piora mínima
+# do valor para registrar de novo o mesmo evento
+ALERT_DEBOUNCE_S = 60
+ALERT_MIN_DELTA = 2
+
+# Validade (s) do cache das coletas de memória (módulos WMI), armazenamento, placa-mãe, sistema e rede
+INFO_CACHE_TTL_S = 30
+
+def ttl_cache(seconds):
+    """Reaproveita o resultado de um método sem argumentos por alguns segundos"""
+    def decorator(method):
+        name = method.__name__
+        
+        @functools.wraps(method)
+        def wrapper(self):
+            return self._cached(name, seconds, functools.partial(method, self))
+        return wrapper
+    return decorator
+
+# Modelo do relatório HTML, montado uma vez na importação (CSS sem chaves escapadas)
+HTML_REPORT_TEMPLATE = Template("""
+<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Relatório de Diagnóstico de PC</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background-color: #1a1a1a;
+            color: #ffffff;
+            margin: 0;
+            padding: 20px;
+            line-height: 1.6;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background-color: #2d2d2d;
+            padding: 30px;
+            border-radius: 10px;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
+        }
+        h1 {
+            color: #00d4ff;
+            text-align: center;
+            border-bottom: 2px solid #00d4ff;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #ffaa00;
+            border-left: 4px solid #ffaa00;
+            padding-left: 10px;
+            margin-top: 30px;
+        }
+        .section {
+            background-color: #3a3a3a;
+            padding: 20px;
+            margin: 15px 0;
+            border-radius: 8px;
+            border-left: 4px solid #00d4ff;
+        }
+        .alert-critical {
+            background-color: #4a1a1a;
+            border-left-color: #ff4444;
+        }
+        .alert-warning {
+            background-color: #4a3a1a;
+            border-left-color: #ffaa00;
+        }
+        .alert-success {
+            background-color: #1a4a1a;
+            border-left-color: #44ff44;
+        }
+        pre {
+            background-color: #1e1e1e;
+            padding: 15px;
+            border-radius: 5px;
+            overflow-x: auto;
+            font-size: 14px;
+            border: 1px solid #444;
+        }
+        .metric-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 20px;
+            margin: 20px 0;
+        }
+        .metric-card {
+            background-color: #404040;
+            padding: 20px;
+            border-radius: 8px;
+            text-align: center;
+        }
+        .metric-value {
+            font-size: 2em;
+            font-weight: bold;
+            color: #00d4ff;
+        }
+        .footer {
+            text-align: center;
+            margin-top: 40px;
+            padding-top: 20px;
+            border-top: 1px solid #555;
+            color: #aaa;
+        }
+        .timestamp {
+            float: right;
+            color: #888;
+            font-size: 0.9em;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🔧 Relatório de Diagnóstico de PC</h1>
+        <div class="timestamp">Gerado em: $gerado_em</div>
+        
+        <div class="section">
+            <h2>📊 Resumo Executivo</h2>
+            <div class="metric-grid">
+                <div class="metric-card">
+                    <div class="metric-value">$n_total</div>
+                    <div>Alertas Detectados</div>
+                </div>
+                <div class="metric-card">
+                    <div class="metric-value">$n_critical</div>
+                    <div>Alertas Críticos</div>
+                </div>
+                <div class="metric-card">
+                    <div class="metric-value">$n_recs</div>
+                    <div>Recomendações</div>
+                </div>
+                <div class="metric-card">
+                    <div class="metric-value">$status</div>
+                    <div>Status Geral</div>
+                </div>
+            </div>
+        </div>
+        
+        <div class="section">
+            <h2>📋 Relatório Completo</h2>
+            <pre>$content</pre>
+        </div>
+        
+        <div class="footer">
+            <p>Sistema de Diagnóstico de PC v1.0</p>
+            <p>Relatório gerado automaticamente</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+# Rótulos legíveis das chaves dos relatórios, calculados uma vez por chave
+_LABELS = {}
+
+def field_label(key):
+    """Converte uma chave em rótulo ('uso_atual' -> 'Uso Atual')"""
+    label = _LABELS.get(key)
+    if label is None:
+        label = _LABELS[key] = key.replace('_', ' ').title()
+    return label
+
+def scan_temperature_alerts(cpu_temp, gpu_temp, limits):
+    """Classifica as temperaturas de uma amostra de uma só vez.
+    
+    Retorna (nivel_cpu, nivel_gpu), onde 0 = normal, 1 = aviso e 2 = crítico.
+    Temperaturas ausentes (None) são consideradas normais.
+    """
+    cpu_level = 0
+    if cpu_temp is not None:
+        if cpu_temp > limits[CPU_C]:
+            cpu_level = 2
+        elif cpu_temp > limits[CPU_W]:
+            cpu_level = 1
+    
+    gpu_level = 0
+    if gpu_temp is not None:
+        if gpu_temp > limits[GPU_C]:
+            gpu_level = 2
+        elif gpu_temp > limits[GPU_W]:
+            gpu_level = 1
+    
+    return cpu_level, gpu_level
+
+class RingBuffer:
+    """Buffer circular de tamanho fixo para séries numéricas de monitoramento"""
+    
+    def __init__(self, capacity=MAX_SAMPLES, typecode='f'):
+        self._data = array(typecode, [0]) * capacity
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+        # Soma e máximo mantidos a cada inserção (máximo None = recalcular)
+        self._total = 0
+        self._peak = None
+        
+    def append(self, value):
+        """Adiciona uma amostra, sobrescrevendo a mais antiga se estiver cheio"""
+        end = (self._start + self._size) % self._capacity
+        if self._size < self._capacity:
+            self._size += 1
+        else:
+            evicted = self._data[end]
+            self._total -= evicted
+            if evicted == self._peak:
+                self._peak = None
+            self._start = (self._start + 1) % self._capacity
+        self._data[end] = value
+        value = self._data[end]  # Valor como armazenado (ex.: precisão de float32)
+        self._total += value
+        if self._peak is not None and value > self._peak:
+            self._peak = value
+        elif self._size == 1:
+            self._peak = value
+            
+    def clear(self, capacity=None):
+        """Descarta todas as amostras, opcionalmente mudando a capacidade"""
+        if capacity is not None and capacity != self._capacity:
+            self._data = array(self._data.typecode, [0]) * capacity
+            self._capacity = capacity
+        self._start = 0
+        self._size = 0
+        self._total = 0
+        self._peak = None
+    
+    def mean(self):
+        """Média das amostras em O(1)"""
+        return self._total / self._size if self._size else 0.0
+    
+    def max(self):
+        """Maior amostra; só percorre o buffer se o máximo anterior foi descartado"""
+        if self._peak is None and self._size:
+            self._peak = max(self.values())
+        return self._peak
+        
+    def __len__(self):
+        return self._size
+    
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("índice fora do buffer")
+        return self._data[(self._start + index) % self._capacity]
+    
+    def __iter__(self):
+        return iter(self.values())
+    
+    def values(self):
+        """Retorna as amostras em ordem cronológica como array contíguo"""
+        end = self._start + self._size
+        if end <= self._capacity:
+            return self._data[self._start:end]
+        return self._data[self._start:] + self._data[:end - self._capacity]
+
 class DiagnosticoPCAvancado:
     def __init__(self):
-        self.console = Console() if available_libs.get('rich') else None
+        self.console = None
+        if available_libs.get('rich'):
+            try:
+                self.console = _lazy('rich.console').Console()
+            except ImportError:
+                pass  # Instalação quebrada do rich: seguir sem console
         self.monitoring = False
         self.monitoring_data = {
-            'cpu_usage': [],
-            'gpu_usage': [],
-            'memory_usage': [],
-            'cpu_temp': [],
-            'gpu_temp': [],
-            'timestamps': []
+            'cpu_usage': RingBuffer(),
+            'gpu_usage': RingBuffer(),
+            'memory_usage': RingBuffer(),
+            'cpu_temp': RingBuffer(),
+            'gpu_temp': RingBuffer(),
+            'timestamps': RingBuffer(typecode='q')  # Epoch em segundos
         }
-        self.alerts = []
+        # Alertas armazenados em colunas paralelas (um item por alerta em cada lista)
+        self.alert_type = []
+        self.alert_component = []
+        self.alert_msg = []
+        self.alert_priority = []
         self.recommendations = []
-        
-        # Limites de temperatura (°C)
-        self.temp_limits = {
-            'cpu_warning': 75,
-            'cpu_critical': 85,
-            'gpu_warning': 80,
-            'gpu_critical': 90,
-            'disk_warning': 50,
-            'disk_critical': 60
-        }
+        # Alertas (índices nas colunas) e recomendações já separados por tipo/prioridade
+        self._alerts_by_type = defaultdict(list)
+        self._recs_by_priority = defaultdict(list)
+        # Último registro de cada evento do monitoramento, para evitar repetições no log
+        self._last_event_ts = {}
+        self._last_event_val = {}
+        self._alert_lock = threading.Lock()  # Coletas paralelas registram alertas
+        
+        # Caches de informações estáticas do CPU
+        self._cpuinfo_cache = None
+        self._cpu_static_cache = None
+        # Consultas e coletas reaproveitadas entre chamadas: chave -> (momento, valor)
+        # (ver _cached e ttl_cache)
+        self._cache = {}
+        
+        # Texto pendente da barra de status (ver _set_status_async)
+        self._pending_status = None
+        self._status_scheduled = False
+        
+        # Thread de coleta do monitoramento
+        self._mon_thread = None
+        
+        # Handle NVML da GPU principal (None = não inicializado, False = indisponível)
+        self._nvml_handle = None
+        self._nvml_static = None
+        
+        # Snapshot das consultas WMI, coletado uma vez por diagnóstico
+        self._wmi_snapshot = None
+        self._wmi_available = True
+        
+        # Sensores de temperatura (None = ainda não testado, False = indisponível)
+        self._temp_sensors_available = None
+        # Sensor da CPU descoberto na primeira leitura: (grupo, índice) e, no Linux,
+        # descritor aberto do arquivo hwmon correspondente
+        self._cpu_temp_key = None
+        self._cpu_temp_fd = None
+        self._temp_lock = threading.Lock()  # Detecção do sensor e fechamento do descritor
+        
+        # Limites de temperatura (°C), indexados por CPU_W, CPU_C, GPU_W, ...
+        self.temp_limits = list(TEMP_LIMITS)
         
         self.setup_gui()
         
+        # Uso de CPU amostrado em segundo plano (evita bloquear 1 s por leitura)
+        self._last_cpu_pct = 0.0
+        if available_libs.get('psutil'):
+            psutil.cpu_percent(interval=None)  # Primeira chamada apenas define a referência
+            self.root.after(CPU_SAMPLE_MS, self._refresh_cpu_percent)
+        
     def setup_gui(self):
         """Configura a interface gráfica"""
         self.root = tk.Tk()
@@ -356,24 +773,226 @@ class DiagnosticoPCAvancado:
         )
         self.recommendations_text.pack(fill='both', expand=True, padx=5, pady=5)
 
+    def _add_alert(self, tipo, componente, mensagem, prioridade):
+        """Registra um alerta"""
+        with self._alert_lock:
+            self._alerts_by_type[tipo].append(len(self.alert_type))
+            self.alert_type.append(tipo)
+            self.alert_component.append(componente)
+            self.alert_msg.append(mensagem)
+            self.alert_priority.append(prioridade)
+
+    def _alerts_of(self, tipo):
+        """Pares (componente, mensagem) dos alertas de um tipo, em ordem de registro"""
+        with self._alert_lock:
+            return [(self.alert_component[i], self.alert_msg[i])
+                    for i in self._alerts_by_type.get(tipo, ())]
+
+    def _clear_alerts(self):
+        """Remove todos os alertas registrados"""
+        with self._alert_lock:
+            self.alert_type.clear()
+            self.alert_component.clear()
+            self.alert_msg.clear()
+            self.alert_priority.clear()
+            self._alerts_by_type.clear()
+
+    def _add_recommendation(self, recommendation):
+        """Registra uma recomendação"""
+        self.recommendations.append(recommendation)
+        self._recs_by_priority[recommendation['prioridade']].append(recommendation)
+
+    def _clear_recommendations(self):
+        """Remove todas as recomendações registradas"""
+        self.recommendations.clear()
+        self._recs_by_priority.clear()
+
+    def _should_log_event(self, chave, valor, now):
+        """Indica se um evento do monitoramento deve ir para o log.
+        
+        O mesmo evento só é registrado de novo após ALERT_DEBOUNCE_S segundos
+        ou se o valor piorar pelo menos ALERT_MIN_DELTA. Usado apenas pela
+        thread de monitoramento.
+        """
+        last_ts = self._last_event_ts.get(chave)
+        if (last_ts is not None and now - last_ts < ALERT_DEBOUNCE_S
+                and valor - self._last_event_val[chave] < ALERT_MIN_DELTA):
+            return False
+        self._last_event_ts[chave] = now
+        self._last_event_val[chave] = valor
+        return True
+
+    def _add_temperature_alert(self, componente, temp, level, warn_idx, crit_idx):
+        """Registra o alerta de temperatura do nível dado por scan_temperature_alerts"""
+        if level == 2:
+            self._add_alert('CRÍTICO', componente,
+                            MSG_TEMP_CRITICAL.format(temp, self.temp_limits[crit_idx]),
+                            'ALTA')
+        elif level == 1:
+            self._add_alert('AVISO', componente,
+                            MSG_TEMP_HIGH.format(temp, self.temp_limits[warn_idx]),
+                            'MÉDIA')
+
+    def _get_cpu_static(self):
+        """Obtém dados do CPU que não mudam durante a execução (com cache)"""
+        if self._cpu_static_cache is None:
+            freq = psutil.cpu_freq()
+            self._cpu_static_cache = {
+                'nucleos_fisicos': psutil.cpu_count(logical=False),
+                'nucleos_logicos': psutil.cpu_count(logical=True),
+                'frequencia_maxima': freq.max if freq else None
+            }
+        return self._cpu_static_cache
+
+    def _load_cpuinfo(self):
+        """Obtém dados do py-cpuinfo com cache em memória e em disco"""
+        if self._cpuinfo_cache is not None:
+            return self._cpuinfo_cache
+        
+        # A sondagem do py-cpuinfo é lenta; reaproveitar resultado de execuções anteriores
+        cache_key = hashlib.sha1(f"{_SYS_INFO['processador']}|{_SYS_INFO['maquina']}".encode('utf-8')).hexdigest()
+        try:
+            with open(CPUINFO_CACHE_FILE, 'r', encoding='utf-8') as cache_file:
+                cached = json.load(cache_file)
+            if cached.get('chave') == cache_key:
+                self._cpuinfo_cache = cached['info']
+                return self._cpuinfo_cache
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass  # Cache inexistente ou inválido, sondar novamente
+        
+        info = _lazy('cpuinfo').get_cpu_info()
+        try:
+            with open(CPUINFO_CACHE_FILE, 'w', encoding='utf-8') as cache_file:
+                json.dump({'chave': cache_key, 'info': info}, cache_file)
+        except (OSError, TypeError, ValueError):
+            pass  # Falha ao gravar cache não impede o diagnóstico
+        
+        self._cpuinfo_cache = info
+        return info
+
+    def _collect_wmi(self):
+        """Coleta de uma só vez as classes WMI usadas no diagnóstico"""
+        if self._wmi_snapshot is None:
+            try:
+                c = _lazy('wmi').WMI()
+                self._wmi_snapshot = {
+                    'mem': list(c.Win32_PhysicalMemory()),
+                    'disk': list(c.Win32_DiskDrive()),
+                    'board': list(c.Win32_BaseBoard()),
+                    'bios': list(c.Win32_BIOS()),
+                    'cpu': list(c.Win32_Processor())
+                }
+            except _wmi_errors():
+                self._wmi_available = False  # Não tentar novamente nesta sessão
+                raise
+        return self._wmi_snapshot
+
+    def _cached(self, key, ttl, fetch):
+        """Valor de fetch() reaproveitado entre chamadas; ttl em segundos (None = não expira)"""
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and (ttl is None or now - entry[0] < ttl):
+            return entry[1]
+        value = fetch()
+        self._cache[key] = (now, value)
+        return value
+
+    def _refresh_cpu_percent(self):
+        """Atualiza periodicamente o uso de CPU com leitura não bloqueante"""
+        if not self.monitoring:  # Durante o monitoramento a própria coleta faz a leitura
+            self._last_cpu_pct = psutil.cpu_percent(interval=None)
+        self.root.after(CPU_SAMPLE_MS, self._refresh_cpu_percent)
+
+    def _get_cpu_raw(self):
+        """Leituras numéricas do CPU, sem formatação"""
+        freq = psutil.cpu_freq()
+        return {
+            'uso': self._last_cpu_pct,
+            'freq_mhz': freq.current if freq else None,
+            'temp_c': self.get_cpu_temperature()
+        }
+
+    def _get_nvml_raw(self):
+        """Leituras da GPU NVIDIA via NVML, reaproveitando o handle do dispositivo"""
+        pynvml = _lazy('pynvml')
+        if self._nvml_handle is None:
+            pynvml.nvmlInit()
+            atexit.register(pynvml.nvmlShutdown)
+            handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            
+            # Dados estáticos lidos uma única vez
+            def as_str(value):
+                return value.decode('utf-8') if isinstance(value, bytes) else value
+            self._nvml_static = {
+                'modelo': as_str(pynvml.nvmlDeviceGetName(handle)),
+                'uuid': as_str(pynvml.nvmlDeviceGetUUID(handle)),
+                'driver': as_str(pynvml.nvmlSystemGetDriverVersion())
+            }
+            self._nvml_handle = handle
+        
+        handle = self._nvml_handle
+        util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+        mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+        raw = dict(self._nvml_static)
+        raw.update({
+            'uso': float(util.gpu),
+            'mem_total_mb': mem.total * _MIB,
+            'mem_usada_mb': mem.used * _MIB,
+            'mem_livre_mb': mem.free * _MIB,
+            'temp_c': float(pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU))
+        })
+        return raw
+
+    def _get_gpu_raw(self):
+        """Leituras numéricas da GPU principal (None se não houver GPU)"""
+        # NVML é consultado direto no driver; GPUtil executa o nvidia-smi a cada chamada
+        if available_libs.get('pynvml') and self._nvml_handle is not False:
+            pynvml = _lazy('pynvml')
+            try:
+                return self._get_nvml_raw()
+            except pynvml.NVMLError:
+                if self._nvml_handle is None:
+                    self._nvml_handle = False  # Sem GPU NVIDIA, usar GPUtil daqui em diante
+        
+        if not available_libs.get('GPUtil'):
+            return None
+        gpus = _lazy('GPUtil').getGPUs()
+        if not gpus:
+            return None
+        gpu = gpus[0]  # GPU principal
+        return {
+            'modelo': gpu.name,
+            'uuid': gpu.uuid,
+            'driver': gpu.driver if hasattr(gpu, 'driver') else 'N/A',
+            'uso': gpu.load * 100,
+            'mem_total_mb': gpu.memoryTotal,
+            'mem_usada_mb': gpu.memoryUsed,
+            'mem_livre_mb': gpu.memoryFree,
+            'temp_c': gpu.temperature
+        }
+
     def get_cpu_info(self):
         """Obtém informações detalhadas do CPU"""
         cpu_info = {"erro": "Informações não disponíveis"}
         
         try:
+            raw = None
             if available_libs.get('psutil'):
                 # Informações básicas do psutil
+                static = self._get_cpu_static()
+                raw = self._get_cpu_raw()
                 cpu_info.update({
-                    "uso_atual": f"{psutil.cpu_percent(interval=1):.1f}%",
-                    "nucleos_fisicos": psutil.cpu_count(logical=False),
-                    "nucleos_logicos": psutil.cpu_count(logical=True),
-                    "frequencia_atual": f"{psutil.cpu_freq().current:.0f} MHz" if psutil.cpu_freq() else "N/A",
-                    "frequencia_maxima": f"{psutil.cpu_freq().max:.0f} MHz" if psutil.cpu_freq() else "N/A",
+                    "uso_atual": f"{raw['uso']:.1f}%",
+                    "uso_atual_raw": raw['uso'],
+                    "nucleos_fisicos": static['nucleos_fisicos'],
+                    "nucleos_logicos": static['nucleos_logicos'],
+                    "frequencia_atual": f"{raw['freq_mhz']:.0f} MHz" if raw['freq_mhz'] is not None else "N/A",
+                    "frequencia_maxima": f"{static['frequencia_maxima']:.0f} MHz" if static['frequencia_maxima'] else "N/A",
                 })
             
             if available_libs.get('cpuinfo'):
                 # Informações detalhadas do py-cpuinfo
-                info = cpuinfo.get_cpu_info()
+                info = self._load_cpuinfo()
                 cpu_info.update({
                     "modelo": info.get('brand_raw', 'N/A'),
                     "fabricante": info.get('vendor_id_raw', 'N/A'),
@@ -381,38 +1000,23 @@ class DiagnosticoPCAvancado:
                     "cache_l1": info.get('l1_data_cache_size', 'N/A'),
                     "cache_l2": info.get('l2_cache_size', 'N/A'),
                     "cache_l3": info.get('l3_cache_size', 'N/A'),
-                    "flags": info.get('flags', [])
                 })
+                # Apenas as extensões exibidas no relatório, não a lista completa
+                flags = set(info.get('flags', ()))
+                cpu_info["flags"] = {label: not flags.isdisjoint(aliases)
+                                     for label, aliases in INTERESTING_FLAGS.items()}
             
             # Temperatura (requer sensores específicos)
-            try:
-                if available_libs.get('psutil'):
-                    sensors = psutil.sensors_temperatures()
-                    if sensors:
-                        for name, entries in sensors.items():
-                            if 'coretemp' in name.lower() or 'cpu' in name.lower():
-                                if entries:
-                                    temp = entries[0].current
-                                    cpu_info["temperatura"] = f"{temp:.1f}°C"
-                                    
-                                    # Verificar alertas de temperatura
-                                    if temp > self.temp_limits['cpu_critical']:
-                                        self.alerts.append({
-                                            'tipo': 'CRÍTICO',
-                                            'componente': 'CPU',
-                                            'mensagem': f'Temperatura crítica: {temp:.1f}°C (limite: {self.temp_limits["cpu_critical"]}°C)',
-                                            'prioridade': 'ALTA'
-                                        })
-                                    elif temp > self.temp_limits['cpu_warning']:
-                                        self.alerts.append({
-                                            'tipo': 'AVISO',
-                                            'componente': 'CPU', 
-                                            'mensagem': f'Temperatura alta: {temp:.1f}°C (limite recomendado: {self.temp_limits["cpu_warning"]}°C)',
-                                            'prioridade': 'MÉDIA'
-                                        })
-                                    break
-            except:
-                cpu_info["temperatura"] = "N/A (sensores não acessíveis)"
+            if raw is not None:
+                temp = raw['temp_c']
+                if temp is None:
+                    cpu_info["temperatura"] = "N/A (sensores não acessíveis)"
+                else:
+                    cpu_info["temperatura"] = f"{temp:.1f}°C"
+                    
+                    # Verificar alertas de temperatura
+                    cpu_level = scan_temperature_alerts(temp, None, self.temp_limits)[0]
+                    self._add_temperature_alert('CPU', temp, cpu_level, CPU_W, CPU_C)
                 
         except Exception as e:
             cpu_info["erro"] = f"Erro ao obter informações do CPU: {str(e)}"
@@ -424,51 +1028,36 @@ class DiagnosticoPCAvancado:
         gpu_info = {"erro": "Informações não disponíveis"}
         
         try:
-            if available_libs.get('GPUtil'):
-                gpus = GPUtil.getGPUs()
-                if gpus:
-                    gpu = gpus[0]  # GPU principal
+            if available_libs.get('pynvml') or available_libs.get('GPUtil'):
+                gpu = self._get_gpu_raw()
+                if gpu:
+                    mem_usage_percent = (gpu['mem_usada_mb'] / gpu['mem_total_mb']) * 100
                     gpu_info = {
-                        "modelo": gpu.name,
-                        "memoria_total": f"{gpu.memoryTotal:.0f} MB",
-                        "memoria_usada": f"{gpu.memoryUsed:.0f} MB",
-                        "memoria_livre": f"{gpu.memoryFree:.0f} MB",
-                        "uso_gpu": f"{gpu.load * 100:.1f}%",
-                        "uso_memoria": f"{(gpu.memoryUsed / gpu.memoryTotal) * 100:.1f}%",
-                        "temperatura": f"{gpu.temperature:.1f}°C",
-                        "uuid": gpu.uuid,
-                        "driver": gpu.driver if hasattr(gpu, 'driver') else 'N/A'
+                        "modelo": gpu['modelo'],
+                        "memoria_total": f"{gpu['mem_total_mb']:.0f} MB",
+                        "memoria_usada": f"{gpu['mem_usada_mb']:.0f} MB",
+                        "memoria_livre": f"{gpu['mem_livre_mb']:.0f} MB",
+                        "uso_gpu": f"{gpu['uso']:.1f}%",
+                        "uso_gpu_raw": gpu['uso'],
+                        "uso_memoria": f"{mem_usage_percent:.1f}%",
+                        "temperatura": f"{gpu['temp_c']:.1f}°C",
+                        "uuid": gpu['uuid'],
+                        "driver": gpu['driver']
                     }
                     
                     # Verificar alertas de temperatura da GPU
-                    if gpu.temperature > self.temp_limits['gpu_critical']:
-                        self.alerts.append({
-                            'tipo': 'CRÍTICO',
-                            'componente': 'GPU',
-                            'mensagem': f'Temperatura crítica: {gpu.temperature:.1f}°C (limite: {self.temp_limits["gpu_critical"]}°C)',
-                            'prioridade': 'ALTA'
-                        })
-                    elif gpu.temperature > self.temp_limits['gpu_warning']:
-                        self.alerts.append({
-                            'tipo': 'AVISO',
-                            'componente': 'GPU',
-                            'mensagem': f'Temperatura alta: {gpu.temperature:.1f}°C (limite recomendado: {self.temp_limits["gpu_warning"]}°C)',
-                            'prioridade': 'MÉDIA'
-                        })
+                    gpu_level = scan_temperature_alerts(None, gpu['temp_c'], self.temp_limits)[1]
+                    self._add_temperature_alert('GPU', gpu['temp_c'], gpu_level, GPU_W, GPU_C)
                     
                     # Verificar uso excessivo de memória
-                    mem_usage_percent = (gpu.memoryUsed / gpu.memoryTotal) * 100
                     if mem_usage_percent > 90:
-                        self.alerts.append({
-                            'tipo': 'AVISO',
-                            'componente': 'GPU',
-                            'mensagem': f'Uso alto de memória VRAM: {mem_usage_percent:.1f}%',
-                            'prioridade': 'MÉDIA'
-                        })
+                        self._add_alert('AVISO', 'GPU',
+                                        f'Uso alto de memória VRAM: {mem_usage_percent:.1f}%',
+                                        'MÉDIA')
                 else:
                     gpu_info = {"erro": "Nenhuma GPU NVIDIA/AMD detectada"}
             else:
-                gpu_info = {"erro": "GPUtil não disponível - instale com: pip install GPUtil"}
+                gpu_info = {"erro": "GPUtil/NVML não disponível - instale com: pip install GPUtil nvidia-ml-py"}
                 
         except Exception as e:
             gpu_info["erro"] = f"Erro ao obter informações da GPU: {str(e)}"
@@ -483,141 +1072,183 @@ class DiagnosticoPCAvancado:
             if available_libs.get('psutil'):
                 mem = psutil.virtual_memory()
                 memory_info = {
-                    "total": f"{mem.total / (1024**3):.2f} GB",
-                    "disponivel": f"{mem.available / (1024**3):.2f} GB",
-                    "usada": f"{mem.used / (1024**3):.2f} GB",
+                    "total": f"{mem.total * _GIB:.2f} GB",
+                    "disponivel": f"{mem.available * _GIB:.2f} GB",
+                    "usada": f"{mem.used * _GIB:.2f} GB",
                     "porcentagem_uso": f"{mem.percent:.1f}%",
-                    "livre": f"{mem.free / (1024**3):.2f} GB",
-                    "em_cache": f"{mem.cached / (1024**3):.2f} GB" if hasattr(mem, 'cached') else 'N/A',
-                    "buffers": f"{mem.buffers / (1024**3):.2f} GB" if hasattr(mem, 'buffers') else 'N/A'
+                    "porcentagem_uso_raw": mem.percent,
+                    "livre": f"{mem.free * _GIB:.2f} GB",
+                    "em_cache": f"{mem.cached * _GIB:.2f} GB" if hasattr(mem, 'cached') else 'N/A',
+                    "buffers": f"{mem.buffers * _GIB:.2f} GB" if hasattr(mem, 'buffers') else 'N/A'
                 }
                 
                 # Verificar uso excessivo de memória
                 if mem.percent > 90:
-                    self.alerts.append({
-                        'tipo': 'CRÍTICO',
-                        'componente': 'RAM',
-                        'mensagem': f'Uso crítico de memória: {mem.percent:.1f}% (Recomendado: <85%)',
-                        'prioridade': 'ALTA'
-                    })
+                    self._add_alert('CRÍTICO', 'RAM',
+                                    f'Uso crítico de memória: {mem.percent:.1f}% (Recomendado: <85%)',
+                                    'ALTA')
                 elif mem.percent > 80:
-                    self.alerts.append({
-                        'tipo': 'AVISO',
-                        'componente': 'RAM',
-                        'mensagem': f'Uso alto de memória: {mem.percent:.1f}% (Recomendado: <80%)',
-                        'prioridade': 'MÉDIA'
-                    })
+                    self._add_alert('AVISO', 'RAM',
+                                    f'Uso alto de memória: {mem.percent:.1f}% (Recomendado: <80%)',
+                                    'MÉDIA')
                 
                 # Informações de SWAP
                 swap = psutil.swap_memory()
                 if swap.total > 0:
                     memory_info.update({
-                        "swap_total": f"{swap.total / (1024**3):.2f} GB",
-                        "swap_usado": f"{swap.used / (1024**3):.2f} GB",
+                        "swap_total": f"{swap.total * _GIB:.2f} GB",
+                        "swap_usado": f"{swap.used * _GIB:.2f} GB",
                         "swap_porcentagem": f"{swap.percent:.1f}%"
                     })
                     
                     if swap.percent > 50:
-                        self.alerts.append({
-                            'tipo': 'AVISO',
-                            'componente': 'SWAP',
-                            'mensagem': f'Uso alto de arquivo de troca: {swap.percent:.1f}%',
-                            'prioridade': 'BAIXA'
-                        })
+                        self._add_alert('AVISO', 'SWAP',
+                                        f'Uso alto de arquivo de troca: {swap.percent:.1f}%',
+                                        'BAIXA')
                 
                 # Tentar obter informações detalhadas via WMI (Windows)
-                if available_libs.get('wmi') and platform.system() == 'Windows':
-                    try:
-                        c = wmi.WMI()
-                        memory_modules = []
-                        for memory in c.Win32_PhysicalMemory():
-                            module_info = {
-                                'capacidade': f"{int(memory.Capacity) / (1024**3):.0f} GB" if memory.Capacity else 'N/A',
-                                'velocidade': f"{memory.Speed} MHz" if memory.Speed else 'N/A',
-                                'tipo': memory.SMBIOSMemoryType or 'N/A',
-                                'fabricante': memory.Manufacturer or 'N/A',
-                                'numero_serie': memory.SerialNumber or 'N/A',
-                                'localizacao': memory.DeviceLocator or 'N/A'
-                            }
-                            memory_modules.append(module_info)
-                        
-                        if memory_modules:
-                            memory_info["modulos"] = memory_modules
-                            memory_info["slots_ocupados"] = len(memory_modules)
-                    except:
-                        pass  # WMI pode falhar, continuar sem informações detalhadas
+                if available_libs.get('wmi') and self._wmi_available and platform.system() == 'Windows':
+                    memory_modules = self._collect_memory_modules()
+                    if memory_modules:
+                        memory_info["modulos"] = memory_modules
+                        memory_info["slots_ocupados"] = len(memory_modules)
                         
         except Exception as e:
             memory_info["erro"] = f"Erro ao obter informações da memória: {str(e)}"
             
         return memory_info
 
+    @ttl_cache(INFO_CACHE_TTL_S)
+    def _collect_memory_modules(self):
+        """Módulos de memória via WMI, em cache como as demais coletas WMI"""
+        memory_modules = []
+        try:
+            wmi_data = self._collect_wmi()
+            for memory in wmi_data['mem']:
+                memory_modules.append({
+                    'capacidade': f"{int(memory.Capacity) * _GIB:.0f} GB" if memory.Capacity else 'N/A',
+                    'velocidade': f"{memory.Speed} MHz" if memory.Speed else 'N/A',
+                    'tipo': SMBIOS_MEMORY_TYPES.get(memory.SMBIOSMemoryType, memory.SMBIOSMemoryType) or 'N/A',
+                    'fabricante': memory.Manufacturer or 'N/A',
+                    'numero_serie': memory.SerialNumber or 'N/A',
+                    'localizacao': memory.DeviceLocator or 'N/A'
+                })
+        except _wmi_errors():
+            pass  # WMI pode falhar, continuar sem informações detalhadas
+        return memory_modules
+
+    def _fast_partitions(self):
+        """Lista partições com uso de espaço: (dispositivo, montagem, fs, total, usado, livre)"""
+        if platform.system() == 'Windows':
+            try:
+                return self._windows_partitions()
+            except (AttributeError, OSError):
+                pass  # API Win32 indisponível, usar psutil
+        
+        partitions = []
+        for partition in psutil.disk_partitions():
+            try:
+                usage = psutil.disk_usage(partition.mountpoint)
+            except PermissionError:
+                continue  # Ignorar dispositivos sem permissão
+            if usage.total:
+                partitions.append((partition.device, partition.mountpoint, partition.fstype,
+                                   usage.total, usage.used, usage.free))
+        return partitions
+
+    def _windows_partitions(self):
+        """Consulta as unidades fixas diretamente pela API Win32.
+        
+        Unidades removíveis, ópticas e de rede são ignoradas, pois consultá-las
+        pode levar segundos (ex.: girar um DVD ou aguardar um compartilhamento).
+        """
+        kernel32 = ctypes.windll.kernel32
+        buf = ctypes.create_unicode_buffer(256)
+        length = kernel32.GetLogicalDriveStringsW(256, buf)
+        
+        partitions = []
+        for drive in buf[:length].split('\x00'):
+            if not drive or kernel32.GetDriveTypeW(drive) not in (DRIVE_FIXED, DRIVE_RAMDISK):
+                continue
+            
+            free = ctypes.c_ulonglong()
+            total = ctypes.c_ulonglong()
+            total_free = ctypes.c_ulonglong()
+            if not kernel32.GetDiskFreeSpaceExW(drive, ctypes.byref(free), ctypes.byref(total),
+                                                ctypes.byref(total_free)) or not total.value:
+                continue
+            
+            fs_name = ctypes.create_unicode_buffer(32)
+            kernel32.GetVolumeInformationW(drive, None, 0, None, None, None, fs_name, 32)
+            partitions.append((drive, drive, fs_name.value,
+                               total.value, total.value - free.value, free.value))
+        return partitions
+
     def get_storage_info(self):
         """Obtém informações detalhadas de armazenamento"""
+        storage_info = self._collect_storage_info()
+        
+        # Verificar espaço em disco (mesmo quando os dados vêm do cache)
+        for device_info in storage_info["dispositivos"]:
+            device = device_info["dispositivo"]
+            usage_percent = device_info["porcentagem_uso_raw"]
+            if usage_percent > 95:
+                self._add_alert('CRÍTICO', 'DISCO',
+                                f'Espaço crítico em {device}: {usage_percent:.1f}% usado',
+                                'ALTA')
+            elif usage_percent > 85:
+                self._add_alert('AVISO', 'DISCO',
+                                f'Espaço baixo em {device}: {usage_percent:.1f}% usado',
+                                'MÉDIA')
+        
+        return storage_info
+
+    @ttl_cache(INFO_CACHE_TTL_S)
+    def _collect_storage_info(self):
+        """Coleta partições, I/O e S.M.A.R.T. dos discos (sem alertas)"""
         storage_info = {"dispositivos": [], "erro": None}
         
         try:
             if available_libs.get('psutil'):
                 # Informações de partições
-                partitions = psutil.disk_partitions()
-                for partition in partitions:
-                    try:
-                        usage = psutil.disk_usage(partition.mountpoint)
-                        device_info = {
-                            "dispositivo": partition.device,
-                            "ponto_montagem": partition.mountpoint,
-                            "sistema_arquivos": partition.fstype,
-                            "tamanho_total": f"{usage.total / (1024**3):.2f} GB",
-                            "usado": f"{usage.used / (1024**3):.2f} GB",
-                            "livre": f"{usage.free / (1024**3):.2f} GB",
-                            "porcentagem_uso": f"{(usage.used / usage.total) * 100:.1f}%"
-                        }
-                        
-                        # Verificar espaço em disco
-                        usage_percent = (usage.used / usage.total) * 100
-                        if usage_percent > 95:
-                            self.alerts.append({
-                                'tipo': 'CRÍTICO',
-                                'componente': 'DISCO',
-                                'mensagem': f'Espaço crítico em {partition.device}: {usage_percent:.1f}% usado',
-                                'prioridade': 'ALTA'
-                            })
-                        elif usage_percent > 85:
-                            self.alerts.append({
-                                'tipo': 'AVISO',
-                                'componente': 'DISCO',
-                                'mensagem': f'Espaço baixo em {partition.device}: {usage_percent:.1f}% usado',
-                                'prioridade': 'MÉDIA'
-                            })
-                        
-                        storage_info["dispositivos"].append(device_info)
-                    except PermissionError:
-                        continue  # Ignorar dispositivos sem permissão
+                for device, mountpoint, fstype, total, used, free in self._fast_partitions():
+                    usage_percent = (used / total) * 100
+                    device_info = {
+                        "dispositivo": device,
+                        "ponto_montagem": mountpoint,
+                        "sistema_arquivos": fstype,
+                        "tamanho_total": f"{total * _GIB:.2f} GB",
+                        "usado": f"{used * _GIB:.2f} GB",
+                        "livre": f"{free * _GIB:.2f} GB",
+                        "porcentagem_uso": f"{usage_percent:.1f}%",
+                        "porcentagem_uso_raw": usage_percent
+                    }
+                    storage_info["dispositivos"].append(device_info)
                 
                 # Informações de I/O de disco
                 try:
                     disk_io = psutil.disk_io_counters()
                     if disk_io:
                         storage_info["estatisticas_io"] = {
-                            "bytes_lidos": f"{disk_io.read_bytes / (1024**3):.2f} GB",
-                            "bytes_escritos": f"{disk_io.write_bytes / (1024**3):.2f} GB",
+                            "bytes_lidos": f"{disk_io.read_bytes * _GIB:.2f} GB",
+                            "bytes_escritos": f"{disk_io.write_bytes * _GIB:.2f} GB",
                             "operacoes_leitura": disk_io.read_count,
                             "operacoes_escrita": disk_io.write_count,
                             "tempo_leitura": f"{disk_io.read_time / 1000:.2f} s",
                             "tempo_escrita": f"{disk_io.write_time / 1000:.2f} s"
                         }
-                except:
-                    pass
+                except (OSError, RuntimeError):
+                    pass  # Contadores de disco indisponíveis
                 
                 # Tentar obter informações S.M.A.R.T. via WMI (Windows)
-                if available_libs.get('wmi') and platform.system() == 'Windows':
+                if available_libs.get('wmi') and self._wmi_available and platform.system() == 'Windows':
                     try:
-                        c = wmi.WMI()
-                        for disk in c.Win32_DiskDrive():
+                        wmi_data = self._collect_wmi()
+                        for disk in wmi_data['disk']:
                             smart_info = {
                                 'modelo': disk.Model or 'N/A',
                                 'interface': disk.InterfaceType or 'N/A',
-                                'tamanho': f"{int(disk.Size) / (1024**3):.2f} GB" if disk.Size else 'N/A',
+                                'tamanho': f"{int(disk.Size) * _GIB:.2f} GB" if disk.Size else 'N/A',
                                 'numero_serie': disk.SerialNumber or 'N/A',
                                 'status': disk.Status or 'N/A'
                             }
@@ -626,7 +1257,7 @@ class DiagnosticoPCAvancado:
                             if storage_info["dispositivos"]:
                                 storage_info["dispositivos"][0]["smart"] = smart_info
                             break
-                    except:
+                    except _wmi_errors():
                         pass  # WMI pode falhar, continuar sem informações S.M.A.R.T.
                         
         except Exception as e:
@@ -634,16 +1265,17 @@ class DiagnosticoPCAvancado:
             
         return storage_info
 
+    @ttl_cache(INFO_CACHE_TTL_S)
     def get_motherboard_info(self):
         """Obtém informações da placa-mãe"""
         mb_info = {"erro": "Informações não disponíveis"}
         
         try:
-            if available_libs.get('wmi') and platform.system() == 'Windows':
-                c = wmi.WMI()
+            if available_libs.get('wmi') and self._wmi_available and platform.system() == 'Windows':
+                wmi_data = self._collect_wmi()
                 
                 # Informações da placa-mãe
-                for board in c.Win32_BaseBoard():
+                for board in wmi_data['board']:
                     mb_info = {
                         "fabricante": board.Manufacturer or 'N/A',
                         "modelo": board.Product or 'N/A',
@@ -653,7 +1285,7 @@ class DiagnosticoPCAvancado:
                     break
                 
                 # Informações da BIOS
-                for bios in c.Win32_BIOS():
+                for bios in wmi_data['bios']:
                     mb_info.update({
                         "bios_fabricante": bios.Manufacturer or 'N/A',
                         "bios_versao": bios.SMBIOSBIOSVersion or 'N/A',
@@ -662,7 +1294,7 @@ class DiagnosticoPCAvancado:
                     break
                 
                 # Informações do processador/chipset
-                for processor in c.Win32_Processor():
+                for processor in wmi_data['cpu']:
                     mb_info.update({
                         "socket": processor.SocketDesignation or 'N/A',
                         "chipset": processor.Description or 'N/A'
@@ -676,28 +1308,21 @@ class DiagnosticoPCAvancado:
             
         return mb_info
 
+    @ttl_cache(INFO_CACHE_TTL_S)
     def get_system_info(self):
         """Obtém informações do sistema operacional"""
         sys_info = {}
         
         try:
-            sys_info = {
-                "sistema": platform.system(),
-                "versao": platform.version(),
-                "release": platform.release(),
-                "arquitetura": platform.architecture()[0],
-                "processador": platform.processor(),
-                "maquina": platform.machine(),
-                "no_computador": platform.node()
-            }
+            sys_info = dict(_SYS_INFO)
             
             if available_libs.get('psutil'):
-                boot_time = datetime.datetime.fromtimestamp(psutil.boot_time())
+                boot_time = datetime.datetime.fromtimestamp(self._cached('boot_time', None, psutil.boot_time))
                 uptime = datetime.datetime.now() - boot_time
                 sys_info.update({
                     "tempo_inicializacao": boot_time.strftime("%Y-%m-%d %H:%M:%S"),
                     "tempo_atividade": str(uptime).split('.')[0],
-                    "usuarios_logados": len(psutil.users()) if psutil.users() else 0
+                    "usuarios_logados": len(psutil.users())
                 })
                 
         except Exception as e:
@@ -705,6 +1330,7 @@ class DiagnosticoPCAvancado:
             
         return sys_info
 
+    @ttl_cache(INFO_CACHE_TTL_S)
     def get_network_info(self):
         """Obtém informações de rede"""
         network_info = {"interfaces": [], "erro": None}
@@ -723,7 +1349,7 @@ class DiagnosticoPCAvancado:
                     
                     for addr in addresses:
                         addr_info = {
-                            "familia": str(addr.family),
+                            "familia": ADDRESS_FAMILIES.get(addr.family, 'OUTRA'),
                             "endereco": addr.address,
                             "mascara": addr.netmask,
                             "broadcast": addr.broadcast
@@ -739,12 +1365,14 @@ class DiagnosticoPCAvancado:
                     
                     network_info["interfaces"].append(interface_info)
                 
-                # Estatísticas de rede
-                net_io = psutil.net_io_counters()
+                # Estatísticas de rede (somente se houver alguma interface ativa)
+                net_io = None
+                if any(iface["ativo"] for iface in network_info["interfaces"]):
+                    net_io = psutil.net_io_counters()
                 if net_io:
                     network_info["estatisticas"] = {
-                        "bytes_enviados": f"{net_io.bytes_sent / (1024**2):.2f} MB",
-                        "bytes_recebidos": f"{net_io.bytes_recv / (1024**2):.2f} MB",
+                        "bytes_enviados": f"{net_io.bytes_sent * _MIB:.2f} MB",
+                        "bytes_recebidos": f"{net_io.bytes_recv * _MIB:.2f} MB",
                         "pacotes_enviados": net_io.packets_sent,
                         "pacotes_recebidos": net_io.packets_recv,
                         "erros_entrada": net_io.errin,
@@ -756,74 +1384,44 @@ class DiagnosticoPCAvancado:
             
         return network_info
 
-    def analyze_health_and_recommendations(self):
-        """Analisa a saúde do sistema e gera recomendações"""
-        self.recommendations.clear()
+    def analyze_health_and_recommendations(self, cpu_info, gpu_info, memory_info, storage_info):
+        """Analisa a saúde do sistema a partir dos dados já coletados e gera recomendações"""
+        # Análise leve, feita na thread do diagnóstico; se ficar pesada, mover para um
+        # ProcessPoolExecutor (em Python free-threaded 3.13t+ as threads já bastam)
+        self._clear_recommendations()
         
         try:
-            # Análise de CPU
-            cpu_info = self.get_cpu_info()
-            if "uso_atual" in cpu_info:
-                cpu_usage = float(cpu_info["uso_atual"].replace("%", ""))
-                if cpu_usage > 80:
-                    self.recommendations.append({
-                        'categoria': 'Performance',
-                        'prioridade': 'ALTA',
-                        'componente': 'CPU',
-                        'problema': f'Uso alto de CPU: {cpu_usage:.1f}%',
-                        'recomendacao': 'Feche programas desnecessários, verifique processos em segundo plano, considere upgrade do processador'
-                    })
-            
-            # Análise de GPU
-            gpu_info = self.get_gpu_info()
-            if "uso_gpu" in gpu_info:
-                gpu_usage = float(gpu_info["uso_gpu"].replace("%", ""))
-                if gpu_usage > 90:
-                    self.recommendations.append({
-                        'categoria': 'Performance',
-                        'prioridade': 'MÉDIA',
-                        'componente': 'GPU',
-                        'problema': f'Uso alto de GPU: {gpu_usage:.1f}%',
-                        'recomendacao': 'Reduza configurações gráficas em jogos/aplicações, verifique drivers atualizados'
+            # Uso de CPU, GPU e memória
+            sections = {'cpu': cpu_info, 'gpu': gpu_info, 'memoria': memory_info}
+            for section, key, limit, categoria, prioridade, componente, problema, recomendacao in HEALTH_RULES:
+                value = sections[section].get(key)
+                if value is not None and value > limit:
+                    self._add_recommendation({
+                        'categoria': categoria,
+                        'prioridade': prioridade,
+                        'componente': componente,
+                        'problema': problema.format(value),
+                        'recomendacao': recomendacao
                     })
             
-            # Análise de memória
-            memory_info = self.get_memory_info()
-            if "porcentagem_uso" in memory_info:
-                mem_usage = float(memory_info["porcentagem_uso"].replace("%", ""))
-                if mem_usage > 85:
-                    self.recommendations.append({
-                        'categoria': 'Hardware',
-                        'prioridade': 'ALTA',
-                        'componente': 'RAM',
-                        'problema': f'Uso alto de memória: {mem_usage:.1f}%',
-                        'recomendacao': 'Considere adicionar mais RAM, feche aplicações não utilizadas, verifique vazamentos de memória'
-                    })
-            
-            # Análise de armazenamento
-            storage_info = self.get_storage_info()
+            # Análise de armazenamento (regra mais grave primeiro)
             for device in storage_info.get("dispositivos", []):
-                if "porcentagem_uso" in device:
-                    storage_usage = float(device["porcentagem_uso"].replace("%", ""))
-                    if storage_usage > 90:
-                        self.recommendations.append({
+                storage_usage = device.get("porcentagem_uso_raw")
+                if storage_usage is None:
+                    continue
+                for limit, prioridade, problema, recomendacao in STORAGE_RULES:
+                    if storage_usage > limit:
+                        self._add_recommendation({
                             'categoria': 'Armazenamento',
-                            'prioridade': 'CRÍTICA',
+                            'prioridade': prioridade,
                             'componente': 'DISCO',
-                            'problema': f'Espaço crítico em {device["dispositivo"]}: {storage_usage:.1f}%',
-                            'recomendacao': 'Libere espaço urgentemente, mova arquivos para disco externo, execute limpeza de disco'
-                        })
-                    elif storage_usage > 80:
-                        self.recommendations.append({
-                            'categoria': 'Armazenamento',
-                            'prioridade': 'MÉDIA',
-                            'componente': 'DISCO',
-                            'problema': f'Espaço baixo em {device["dispositivo"]}: {storage_usage:.1f}%',
-                            'recomendacao': 'Execute limpeza de arquivos temporários, desinstale programas não utilizados'
+                            'problema': problema.format(device["dispositivo"], storage_usage),
+                            'recomendacao': recomendacao
                         })
+                        break
             
             # Recomendações de manutenção preventiva
-            self.recommendations.append({
+            self._add_recommendation({
                 'categoria': 'Manutenção',
                 'prioridade': 'BAIXA',
                 'componente': 'GERAL',
@@ -832,7 +1430,7 @@ class DiagnosticoPCAvancado:
             })
             
             # Recomendações de segurança
-            self.recommendations.append({
+            self._add_recommendation({
                 'categoria': 'Segurança',
                 'prioridade': 'MÉDIA',
                 'componente': 'SISTEMA',
@@ -841,7 +1439,7 @@ class DiagnosticoPCAvancado:
             })
             
         except Exception as e:
-            self.recommendations.append({
+            self._add_recommendation({
                 'categoria': 'Sistema',
                 'prioridade': 'BAIXA',
                 'componente': 'DIAGNÓSTICO',
@@ -849,232 +1447,291 @@ class DiagnosticoPCAvancado:
                 'recomendacao': f'Erro durante análise de saúde: {str(e)}'
             })
 
+    def _set_status_async(self, text):
+        """Atualiza a barra de status a partir de outra thread, agrupando mudanças rápidas"""
+        self._pending_status = text
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.root.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Exibe na barra de status o texto mais recente pendente"""
+        self._status_scheduled = False
+        self.status_var.set(self._pending_status)
+
+    def _set_text(self, widget, text):
+        """Substitui o conteúdo de um widget de texto somente leitura em uma única operação"""
+        widget.configure(state='normal')
+        widget.delete('1.0', tk.END)
+        if text:
+            widget.insert('1.0', text)
+        widget.configure(state='disabled')
+
     def run_complete_diagnosis(self):
         """Executa diagnóstico completo do hardware"""
         self.status_var.set("Executando diagnóstico completo...")
-        self.hardware_text.delete('1.0', tk.END)
+        self._set_text(self.hardware_text, '')
         
         def diagnosis_thread():
             try:
-                self.alerts.clear()
-                self.recommendations.clear()
-                
-                # Cabeçalho
-                report = "🔧 RELATÓRIO DE DIAGNÓSTICO COMPLETO DE PC\n"
-                report += "=" * 60 + "\n"
-                report += f"Data/Hora: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-                report += f"Sistema: {platform.system()} {platform.release()}\n\n"
-                
-                # Diagnóstico de CPU
-                self.root.after(0, lambda: self.status_var.set("Analisando CPU..."))
-                report += "🖥️  PROCESSADOR (CPU)\n" + "-" * 30 + "\n"
-                cpu_info = self.get_cpu_info()
-                for key, value in cpu_info.items():
-                    if key != "flags":
-                        report += f"{key.replace('_', ' ').title()}: {value}\n"
-                report += "\n"
-                
-                # Diagnóstico de GPU
-                self.root.after(0, lambda: self.status_var.set("Analisando GPU..."))
-                report += "🎮 PLACA DE VÍDEO (GPU)\n" + "-" * 30 + "\n"
-                gpu_info = self.get_gpu_info()
-                for key, value in gpu_info.items():
-                    report += f"{key.replace('_', ' ').title()}: {value}\n"
-                report += "\n"
-                
-                # Diagnóstico de Memória
-                self.root.after(0, lambda: self.status_var.set("Analisando Memória RAM..."))
-                report += "💾 MEMÓRIA RAM\n" + "-" * 30 + "\n"
-                memory_info = self.get_memory_info()
-                for key, value in memory_info.items():
-                    if key != "modulos":
-                        report += f"{key.replace('_', ' ').title()}: {value}\n"
-                
-                if "modulos" in memory_info:
-                    report += "\n📋 Módulos de Memória Detectados:\n"
-                    for i, module in enumerate(memory_info["modulos"], 1):
-                        report += f"  Módulo {i}:\n"
-                        for mod_key, mod_value in module.items():
-                            report += f"    {mod_key.replace('_', ' ').title()}: {mod_value}\n"
-                report += "\n"
-                
-                # Diagnóstico de Armazenamento
-                self.root.after(0, lambda: self.status_var.set("Analisando Armazenamento..."))
-                report += "💿 ARMAZENAMENTO\n" + "-" * 30 + "\n"
-                storage_info = self.get_storage_info()
-                
-                if storage_info.get("erro"):
-                    report += f"Erro: {storage_info['erro']}\n"
-                else:
-                    for i, device in enumerate(storage_info.get("dispositivos", []), 1):
-                        report += f"Dispositivo {i}:\n"
-                        for dev_key, dev_value in device.items():
-                            if dev_key != "smart":
-                                report += f"  {dev_key.replace('_', ' ').title()}: {dev_value}\n"
-                        
-                        if "smart" in device:
-                            report += "  Informações S.M.A.R.T.:\n"
-                            for smart_key, smart_value in device["smart"].items():
-                                report += f"    {smart_key.replace('_', ' ').title()}: {smart_value}\n"
-                        report += "\n"
-                    
-                    if "estatisticas_io" in storage_info:
-                        report += "📊 Estatísticas de I/O:\n"
-                        for stat_key, stat_value in storage_info["estatisticas_io"].items():
-                            report += f"  {stat_key.replace('_', ' ').title()}: {stat_value}\n"
-                        report += "\n"
-                
-                # Informações da Placa-mãe
-                self.root.after(0, lambda: self.status_var.set("Analisando Placa-mãe..."))
-                report += "⚡ PLACA-MÃE\n" + "-" * 30 + "\n"
-                mb_info = self.get_motherboard_info()
-                for key, value in mb_info.items():
-                    report += f"{key.replace('_', ' ').title()}: {value}\n"
-                report += "\n"
-                
-                # Informações do Sistema
-                self.root.after(0, lambda: self.status_var.set("Analisando Sistema..."))
-                report += "🖥️  SISTEMA OPERACIONAL\n" + "-" * 30 + "\n"
-                sys_info = self.get_system_info()
-                for key, value in sys_info.items():
-                    report += f"{key.replace('_', ' ').title()}: {value}\n"
-                report += "\n"
+                self._clear_alerts()
+                self._clear_recommendations()
                 
-                # Informações de Rede
-                self.root.after(0, lambda: self.status_var.set("Analisando Rede..."))
-                report += "🌐 REDE\n" + "-" * 30 + "\n"
-                network_info = self.get_network_info()
+                data = {'inicio': datetime.datetime.now()}
                 
-                if network_info.get("erro"):
-                    report += f"Erro: {network_info['erro']}\n"
-                else:
-                    # Mostrar apenas interfaces ativas
-                    active_interfaces = [iface for iface in network_info.get("interfaces", []) if iface.get("ativo")]
-                    if active_interfaces:
-                        report += "Interfaces Ativas:\n"
-                        for interface in active_interfaces:
-                            report += f"  {interface['nome']}:\n"
-                            if "velocidade" in interface:
-                                report += f"    Velocidade: {interface['velocidade']}\n"
-                            if "mtu" in interface:
-                                report += f"    MTU: {interface['mtu']}\n"
-                            
-                            # Mostrar apenas endereços IPv4
-                            ipv4_addresses = [addr for addr in interface.get("enderecos", []) 
-                                            if "IPv4" in addr.get("familia", "") or "2" in addr.get("familia", "")]
-                            if ipv4_addresses:
-                                for addr in ipv4_addresses[:1]:  # Mostrar apenas o primeiro
-                                    report += f"    IP: {addr['endereco']}\n"
-                    
-                    if "estatisticas" in network_info:
-                        report += "\n📊 Estatísticas de Rede:\n"
-                        for stat_key, stat_value in network_info["estatisticas"].items():
-                            report += f"  {stat_key.replace('_', ' ').title()}: {stat_value}\n"
-                report += "\n"
+                # Coletas independentes em paralelo; as que usam WMI ficam juntas
+                # em uma única tarefa, pois objetos COM não são compartilháveis entre threads
+                getters = {
+                    'cpu': self.get_cpu_info,
+                    'gpu': self.get_gpu_info,
+                    'sistema': self.get_system_info,
+                    'rede': self.get_network_info,
+                    'wmi': self._wmi_combined_getter
+                }
+                self._set_status_async("Analisando hardware...")
+                with ThreadPoolExecutor(max_workers=len(getters)) as executor:
+                    futures = {executor.submit(fn): name for name, fn in getters.items()}
+                    for done, future in enumerate(as_completed(futures), 1):
+                        name = futures[future]
+                        if name == 'wmi':
+                            data.update(future.result())
+                        else:
+                            data[name] = future.result()
+                        self._set_status_async(f"Analisando hardware... ({done}/{len(getters)})")
                 
                 # Análise de saúde e recomendações
-                self.root.after(0, lambda: self.status_var.set("Gerando recomendações..."))
-                self.analyze_health_and_recommendations()
-                
-                # Alertas críticos
-                critical_alerts = [alert for alert in self.alerts if alert['tipo'] == 'CRÍTICO']
-                if critical_alerts:
-                    report += "🚨 ALERTAS CRÍTICOS\n" + "-" * 30 + "\n"
-                    for alert in critical_alerts:
-                        report += f"⚠️  {alert['componente']}: {alert['mensagem']}\n"
-                    report += "\n"
-                
-                # Avisos
-                warnings = [alert for alert in self.alerts if alert['tipo'] == 'AVISO']
-                if warnings:
-                    report += "⚠️  AVISOS\n" + "-" * 30 + "\n"
-                    for warning in warnings:
-                        report += f"🔶 {warning['componente']}: {warning['mensagem']}\n"
-                    report += "\n"
-                
-                # Recomendações por prioridade
-                if self.recommendations:
-                    report += "💡 RECOMENDAÇÕES\n" + "-" * 30 + "\n"
-                    
-                    priorities = ['CRÍTICA', 'ALTA', 'MÉDIA', 'BAIXA']
-                    for priority in priorities:
-                        priority_recs = [rec for rec in self.recommendations if rec['prioridade'] == priority]
-                        if priority_recs:
-                            report += f"\n🔴 Prioridade {priority}:\n"
-                            for rec in priority_recs:
-                                report += f"  • {rec['componente']}: {rec['recomendacao']}\n"
-                    report += "\n"
+                self._set_status_async("Gerando recomendações...")
+                self.analyze_health_and_recommendations(
+                    data['cpu'], data['gpu'], data['memoria'], data['armazenamento'])
                 
-                # Rodapé
-                report += "=" * 60 + "\n"
-                report += "✅ Diagnóstico concluído com sucesso!\n"
-                report += f"🕐 Tempo de execução: ~{datetime.datetime.now().strftime('%H:%M:%S')}\n"
-                report += "💾 Para salvar este relatório, use os botões 'Exportar' acima.\n"
+                report = self._render_report(data)
                 
-                # Mostrar resultado na GUI
-                self.root.after(0, lambda: self.hardware_text.insert('1.0', report))
-                self.root.after(0, lambda: self.update_alerts_tab())
-                self.root.after(0, lambda: self.status_var.set("Diagnóstico completo finalizado!"))
+                # Mostrar resultado na GUI (uma única inserção no widget)
+                self.root.after(0, self._set_text, self.hardware_text, report)
+                self.root.after(0, self.update_alerts_tab)
+                self._set_status_async("Diagnóstico completo finalizado!")
                 
                 # Salvar log
                 self.save_diagnosis_log(report)
                 
             except Exception as e:
                 error_msg = f"❌ Erro durante o diagnóstico: {str(e)}\n"
-                self.root.after(0, lambda: self.hardware_text.insert('1.0', error_msg))
-                self.root.after(0, lambda: self.status_var.set("Erro no diagnóstico"))
+                self.root.after(0, self._set_text, self.hardware_text, error_msg)
+                self._set_status_async("Erro no diagnóstico")
         
         # Executar em thread separada para não travar a GUI
         thread = threading.Thread(target=diagnosis_thread)
         thread.daemon = True
         thread.start()
 
-    def update_alerts_tab(self):
-        """Atualiza a aba de alertas com os alertas atuais"""
-        # Limpar textos anteriores
-        self.critical_alerts_text.delete('1.0', tk.END)
-        self.recommendations_text.delete('1.0', tk.END)
+    def _wmi_combined_getter(self):
+        """Coleta, em uma única thread, as informações que dependem de WMI"""
+        com_init = available_libs.get('wmi') and platform.system() == 'Windows'
+        if com_init:
+            _lazy('pythoncom').CoInitialize()  # Necessário para WMI fora da thread principal
+        try:
+            return {
+                'memoria': self.get_memory_info(),
+                'armazenamento': self.get_storage_info(),
+                'placa_mae': self.get_motherboard_info()
+            }
+        finally:
+            # Liberar os objetos COM antes de encerrar o apartment que os criou;
+            # o próximo diagnóstico faz uma nova coleta WMI
+            self._wmi_snapshot = None
+            if com_init:
+                _lazy('pythoncom').CoUninitialize()
+
+    def _render_report(self, data):
+        """Monta o texto do relatório de diagnóstico a partir dos dados coletados"""
+        parts = []
+        
+        # Cabeçalho
+        parts.append("🔧 RELATÓRIO DE DIAGNÓSTICO COMPLETO DE PC\n")
+        parts.append("=" * 60 + "\n")
+        parts.append(f"Data/Hora: {data['inicio'].strftime('%Y-%m-%d %H:%M:%S')}\n")
+        parts.append(f"Sistema: {_SYS_INFO['sistema']} {_SYS_INFO['release']}\n\n")
+        
+        # Diagnóstico de CPU
+        parts.append("🖥️  PROCESSADOR (CPU)\n" + "-" * 30 + "\n")
+        for key, value in data['cpu'].items():
+            if key.endswith("_raw"):
+                continue
+            if key == "flags":
+                supported = [flag.upper() for flag, present in value.items() if present]
+                parts.append(f"Extensões: {', '.join(supported) or 'N/A'}\n")
+            else:
+                parts.append(f"{field_label(key)}: {value}\n")
+        parts.append("\n")
+        
+        # Diagnóstico de GPU
+        parts.append("🎮 PLACA DE VÍDEO (GPU)\n" + "-" * 30 + "\n")
+        for key, value in data['gpu'].items():
+            if not key.endswith("_raw"):
+                parts.append(f"{field_label(key)}: {value}\n")
+        parts.append("\n")
+        
+        # Diagnóstico de Memória
+        parts.append("💾 MEMÓRIA RAM\n" + "-" * 30 + "\n")
+        memory_info = data['memoria']
+        for key, value in memory_info.items():
+            if key != "modulos" and not key.endswith("_raw"):
+                parts.append(f"{field_label(key)}: {value}\n")
+        
+        if "modulos" in memory_info:
+            parts.append("\n📋 Módulos de Memória Detectados:\n")
+            for i, module in enumerate(memory_info["modulos"], 1):
+                parts.append(f"  Módulo {i}:\n")
+                for mod_key, mod_value in module.items():
+                    parts.append(f"    {field_label(mod_key)}: {mod_value}\n")
+        parts.append("\n")
+        
+        # Diagnóstico de Armazenamento
+        parts.append("💿 ARMAZENAMENTO\n" + "-" * 30 + "\n")
+        storage_info = data['armazenamento']
+        
+        if storage_info.get("erro"):
+            parts.append(f"Erro: {storage_info['erro']}\n")
+        else:
+            for i, device in enumerate(storage_info.get("dispositivos", []), 1):
+                parts.append(f"Dispositivo {i}:\n")
+                for dev_key, dev_value in device.items():
+                    if dev_key != "smart" and not dev_key.endswith("_raw"):
+                        parts.append(f"  {field_label(dev_key)}: {dev_value}\n")
+                
+                if "smart" in device:
+                    parts.append("  Informações S.M.A.R.T.:\n")
+                    for smart_key, smart_value in device["smart"].items():
+                        parts.append(f"    {field_label(smart_key)}: {smart_value}\n")
+                parts.append("\n")
+            
+            if "estatisticas_io" in storage_info:
+                parts.append("📊 Estatísticas de I/O:\n")
+                for stat_key, stat_value in storage_info["estatisticas_io"].items():
+                    parts.append(f"  {field_label(stat_key)}: {stat_value}\n")
+                parts.append("\n")
+        
+        # Informações da Placa-mãe
+        parts.append("⚡ PLACA-MÃE\n" + "-" * 30 + "\n")
+        for key, value in data['placa_mae'].items():
+            parts.append(f"{field_label(key)}: {value}\n")
+        parts.append("\n")
+        
+        # Informações do Sistema
+        parts.append("🖥️  SISTEMA OPERACIONAL\n" + "-" * 30 + "\n")
+        for key, value in data['sistema'].items():
+            parts.append(f"{field_label(key)}: {value}\n")
+        parts.append("\n")
+        
+        # Informações de Rede
+        parts.append("🌐 REDE\n" + "-" * 30 + "\n")
+        network_info = data['rede']
+        
+        if network_info.get("erro"):
+            parts.append(f"Erro: {network_info['erro']}\n")
+        else:
+            # Mostrar apenas interfaces ativas
+            active_interfaces = [iface for iface in network_info.get("interfaces", []) if iface.get("ativo")]
+            if active_interfaces:
+                parts.append("Interfaces Ativas:\n")
+                for interface in active_interfaces:
+                    parts.append(f"  {interface['nome']}:\n")
+                    if "velocidade" in interface:
+                        parts.append(f"    Velocidade: {interface['velocidade']}\n")
+                    if "mtu" in interface:
+                        parts.append(f"    MTU: {interface['mtu']}\n")
+                    
+                    # Mostrar apenas endereços IPv4
+                    ipv4_addresses = [addr for addr in interface.get("enderecos", [])
+                                      if addr.get("familia") == "IPv4"]
+                    if ipv4_addresses:
+                        for addr in ipv4_addresses[:1]:  # Mostrar apenas o primeiro
+                            parts.append(f"    IP: {addr['endereco']}\n")
+            
+            if "estatisticas" in network_info:
+                parts.append("\n📊 Estatísticas de Rede:\n")
+                for stat_key, stat_value in network_info["estatisticas"].items():
+                    parts.append(f"  {field_label(stat_key)}: {stat_value}\n")
+        parts.append("\n")
         
         # Alertas críticos
-        critical_alerts = [alert for alert in self.alerts if alert['tipo'] == 'CRÍTICO']
-        warnings = [alert for alert in self.alerts if alert['tipo'] == 'AVISO']
+        critical_alerts = self._alerts_of('CRÍTICO')
+        if critical_alerts:
+            parts.append("🚨 ALERTAS CRÍTICOS\n" + "-" * 30 + "\n")
+            for componente, mensagem in critical_alerts:
+                parts.append(f"⚠️  {componente}: {mensagem}\n")
+            parts.append("\n")
+        
+        # Avisos
+        warnings = self._alerts_of('AVISO')
+        if warnings:
+            parts.append("⚠️  AVISOS\n" + "-" * 30 + "\n")
+            for componente, mensagem in warnings:
+                parts.append(f"🔶 {componente}: {mensagem}\n")
+            parts.append("\n")
+        
+        # Recomendações por prioridade
+        if self.recommendations:
+            parts.append("💡 RECOMENDAÇÕES\n" + "-" * 30 + "\n")
+            
+            for priority in REC_PRIORITIES:
+                priority_recs = self._recs_by_priority[priority]
+                if priority_recs:
+                    parts.append(f"\n🔴 Prioridade {priority}:\n")
+                    for rec in priority_recs:
+                        parts.append(f"  • {rec['componente']}: {rec['recomendacao']}\n")
+            parts.append("\n")
+        
+        # Rodapé
+        parts.append("=" * 60 + "\n")
+        parts.append("✅ Diagnóstico concluído com sucesso!\n")
+        parts.append(f"🕐 Tempo de execução: ~{datetime.datetime.now().strftime('%H:%M:%S')}\n")
+        parts.append("💾 Para salvar este relatório, use os botões 'Exportar' acima.\n")
+        
+        return ''.join(parts)
+
+    def update_alerts_tab(self):
+        """Atualiza a aba de alertas com os alertas atuais"""
+        # Alertas críticos e avisos (já separados por tipo no registro)
+        critical_alerts = self._alerts_of('CRÍTICO')
+        warnings = self._alerts_of('AVISO')
         
         if critical_alerts or warnings:
-            alert_text = "🚨 ALERTAS DETECTADOS\n" + "=" * 40 + "\n\n"
+            parts = ["🚨 ALERTAS DETECTADOS\n" + "=" * 40 + "\n\n"]
             
             if critical_alerts:
-                alert_text += "🔴 CRÍTICOS:\n"
-                for alert in critical_alerts:
-                    alert_text += f"⚠️  {alert['componente']}: {alert['mensagem']}\n"
-                alert_text += "\n"
+                parts.append("🔴 CRÍTICOS:\n")
+                for componente, mensagem in critical_alerts:
+                    parts.append(f"⚠️  {componente}: {mensagem}\n")
+                parts.append("\n")
             
             if warnings:
-                alert_text += "🟡 AVISOS:\n"
-                for warning in warnings:
-                    alert_text += f"🔶 {warning['componente']}: {warning['mensagem']}\n"
+                parts.append("🟡 AVISOS:\n")
+                for componente, mensagem in warnings:
+                    parts.append(f"🔶 {componente}: {mensagem}\n")
             
         else:
-            alert_text = "✅ SISTEMA SAUDÁVEL\n\nNenhum alerta crítico detectado."
+            parts = ["✅ SISTEMA SAUDÁVEL\n\nNenhum alerta crítico detectado."]
         
-        self.critical_alerts_text.insert('1.0', alert_text)
+        # Substituir o conteúdo anterior em uma única operação
+        self.critical_alerts_text.replace('1.0', tk.END, ''.join(parts))
         
         # Recomendações
         if self.recommendations:
-            rec_text = "💡 RECOMENDAÇÕES DE MELHORIA\n" + "=" * 40 + "\n\n"
+            parts = ["💡 RECOMENDAÇÕES DE MELHORIA\n" + "=" * 40 + "\n\n"]
             
-            priorities = ['CRÍTICA', 'ALTA', 'MÉDIA', 'BAIXA']
-            for priority in priorities:
-                priority_recs = [rec for rec in self.recommendations if rec['prioridade'] == priority]
+            for priority in REC_PRIORITIES:
+                priority_recs = self._recs_by_priority[priority]
                 if priority_recs:
-                    rec_text += f"🔴 PRIORIDADE {priority}:\n"
+                    parts.append(f"🔴 PRIORIDADE {priority}:\n")
                     for i, rec in enumerate(priority_recs, 1):
-                        rec_text += f"{i}. [{rec['categoria']}] {rec['componente']}:\n"
-                        rec_text += f"   Problema: {rec['problema']}\n"
-                        rec_text += f"   Solução: {rec['recomendacao']}\n\n"
+                        parts.append(f"{i}. [{rec['categoria']}] {rec['componente']}:\n")
+                        parts.append(f"   Problema: {rec['problema']}\n")
+                        parts.append(f"   Solução: {rec['recomendacao']}\n\n")
         else:
-            rec_text = "✅ SISTEMA OTIMIZADO\n\nNenhuma recomendação específica no momento."
+            parts = ["✅ SISTEMA OTIMIZADO\n\nNenhuma recomendação específica no momento."]
         
-        self.recommendations_text.insert('1.0', rec_text)
+        self.recommendations_text.replace('1.0', tk.END, ''.join(parts))
 
     def toggle_monitoring(self):
         """Inicia/para o monitoramento em tempo real"""
@@ -1088,122 +1745,201 @@ class DiagnosticoPCAvancado:
         self.monitoring = True
         self.monitoring_button.config(text="⏹️ Parar Monitoramento")
         
-        # Limpar dados anteriores
-        for key in self.monitoring_data:
-            self.monitoring_data[key].clear()
-        
         # Duração do monitoramento em minutos
         duration_minutes = int(self.duration_var.get())
         
+        # Limpar dados anteriores; buffers crescem se a duração digitada passar de 30 min
+        capacity = max(MAX_SAMPLES, duration_minutes * 60 // MONITORING_INTERVAL + 16)
+        for buffer in self.monitoring_data.values():
+            buffer.clear(capacity)
+        self._last_event_ts.clear()
+        self._last_event_val.clear()
+        
         self.monitoring_log.delete('1.0', tk.END)
         self.monitoring_log.insert(tk.END, f"🟢 Monitoramento iniciado por {duration_minutes} minutos...\n")
         self.monitoring_log.insert(tk.END, f"Início: {datetime.datetime.now().strftime('%H:%M:%S')}\n\n")
         
-        def monitoring_thread():
-            start_time = time.time()
-            end_time = start_time + (duration_minutes * 60)  # Converter para segundos
+        # Sem nova referência de CPU aqui: a de _refresh_cpu_percent (até CPU_SAMPLE_MS atrás)
+        # cobre a primeira amostra; renová-la agora faria a primeira leitura sair 0%
+        
+        # Iniciar thread de monitoramento
+        end_time = time.monotonic() + (duration_minutes * 60)  # Converter para segundos
+        self._mon_thread = threading.Thread(target=self._monitor_loop, args=(end_time,))
+        self._mon_thread.daemon = True
+        self._mon_thread.start()
+
+    def _snapshot(self, now):
+        """Coleta uma amostra de todos os sensores e grava nos buffers"""
+        data = self.monitoring_data
+        sample = {'hora': now, 'cpu': None, 'cpu_temp': None,
+                  'mem': None, 'mem_livre_gb': None, 'gpu': None, 'gpu_temp': None}
+        data['timestamps'].append(int(sample['hora'].timestamp()))
+        
+        # Dados de CPU e memória
+        if available_libs.get('psutil'):
+            # Uso médio desde a amostra anterior, sem bloquear
+            sample['cpu'] = self._last_cpu_pct = psutil.cpu_percent(interval=None)
+            data['cpu_usage'].append(sample['cpu'])
             
-            while self.monitoring and time.time() < end_time:
-                try:
-                    current_time = datetime.datetime.now()
-                    self.monitoring_data['timestamps'].append(current_time)
-                    
-                    # Coletar dados de CPU
-                    if available_libs.get('psutil'):
-                        cpu_percent = psutil.cpu_percent(interval=1)
-                        self.monitoring_data['cpu_usage'].append(cpu_percent)
-                        
-                        # Tentar obter temperatura da CPU
-                        cpu_temp = self.get_cpu_temperature()
-                        if cpu_temp:
-                            self.monitoring_data['cpu_temp'].append(cpu_temp)
-                        
-                        # Dados de memória
-                        memory = psutil.virtual_memory()
-                        self.monitoring_data['memory_usage'].append(memory.percent)
-                    
-                    # Coletar dados de GPU
-                    if available_libs.get('GPUtil'):
-                        try:
-                            gpus = GPUtil.getGPUs()
-                            if gpus:
-                                gpu = gpus[0]
-                                self.monitoring_data['gpu_usage'].append(gpu.load * 100)
-                                self.monitoring_data['gpu_temp'].append(gpu.temperature)
-                        except:
-                            pass
-                    
-                    # Atualizar GUI com valores atuais
-                    self.root.after(0, lambda: self.update_realtime_display())
-                    
-                    # Log de eventos significativos
-                    if cpu_percent > 80:
-                        log_msg = f"[{current_time.strftime('%H:%M:%S')}] ⚠️  CPU alta: {cpu_percent:.1f}%\n"
-                        self.root.after(0, lambda msg=log_msg: self.monitoring_log.insert(tk.END, msg))
-                    
-                    if available_libs.get('psutil'):
-                        memory = psutil.virtual_memory()
-                        if memory.percent > 85:
-                            log_msg = f"[{current_time.strftime('%H:%M:%S')}] ⚠️  RAM alta: {memory.percent:.1f}%\n"
-                            self.root.after(0, lambda msg=log_msg: self.monitoring_log.insert(tk.END, msg))
-                    
-                    # Aguardar 2 segundos antes da próxima coleta
-                    time.sleep(2)
-                    
-                except Exception as e:
-                    error_msg = f"[{datetime.datetime.now().strftime('%H:%M:%S')}] ❌ Erro: {str(e)}\n"
-                    self.root.after(0, lambda msg=error_msg: self.monitoring_log.insert(tk.END, msg))
-                    time.sleep(2)
+            # Temperatura da CPU (quando houver sensor); frequência não é amostrada
+            cpu_temp = self.get_cpu_temperature()
+            if cpu_temp:
+                sample['cpu_temp'] = cpu_temp
+                data['cpu_temp'].append(cpu_temp)
             
-            # Finalizar monitoramento
-            self.root.after(0, self.finish_monitoring)
+            memory = psutil.virtual_memory()
+            sample['mem'] = memory.percent
+            sample['mem_livre_gb'] = memory.available * _GIB
+            data['memory_usage'].append(sample['mem'])
         
-        # Iniciar thread de monitoramento
-        monitor_thread = threading.Thread(target=monitoring_thread)
-        monitor_thread.daemon = True
-        monitor_thread.start()
+        # Dados de GPU
+        if available_libs.get('pynvml') or available_libs.get('GPUtil'):
+            try:
+                gpu = self._get_gpu_raw()
+                if gpu:
+                    sample['gpu'] = gpu['uso']
+                    sample['gpu_temp'] = gpu['temp_c']
+                    data['gpu_usage'].append(sample['gpu'])
+                    data['gpu_temp'].append(sample['gpu_temp'])
+            except Exception:
+                pass  # Falha na leitura da GPU não descarta CPU/RAM já coletados
+        
+        return sample
+
+    def _monitor_loop(self, end_time):
+        """Laço de coleta com cadência fixa, executado fora da thread da GUI"""
+        next_t = time.monotonic()
+        
+        while self.monitoring and time.monotonic() < end_time:
+            sample = None
+            log_lines = []
+            # Horário da coleta, formatado uma única vez para todas as mensagens
+            now = datetime.datetime.now()
+            stamp = now.strftime('%H:%M:%S')
+            try:
+                sample = self._snapshot(now)
+                
+                # Log de eventos significativos (repetições seguidas são omitidas)
+                tick = time.monotonic()
+                cpu_percent = sample['cpu']
+                if (cpu_percent is not None and cpu_percent > 80
+                        and self._should_log_event(('CPU', 'uso'), cpu_percent, tick)):
+                    log_lines.append(f"[{stamp}] ⚠️  CPU alta: {cpu_percent:.1f}%\n")
+                
+                if (sample['mem'] is not None and sample['mem'] > 85
+                        and self._should_log_event(('RAM', 'uso'), sample['mem'], tick)):
+                    log_lines.append(f"[{stamp}] ⚠️  RAM alta: {sample['mem']:.1f}%\n")
+                
+                # Verificar limites de temperatura da amostra; o nível faz parte da chave,
+                # então passar de aviso para crítico é registrado na hora
+                cpu_temp, gpu_temp = sample['cpu_temp'], sample['gpu_temp']
+                cpu_level, gpu_level = scan_temperature_alerts(cpu_temp, gpu_temp, self.temp_limits)
+                if cpu_level and self._should_log_event(('CPU', 'temp', cpu_level), cpu_temp, tick):
+                    log_lines.append(f"[{stamp}] {'🔥' if cpu_level == 2 else '⚠️ '} CPU quente: {cpu_temp:.1f}°C\n")
+                if gpu_level and self._should_log_event(('GPU', 'temp', gpu_level), gpu_temp, tick):
+                    log_lines.append(f"[{stamp}] {'🔥' if gpu_level == 2 else '⚠️ '} GPU quente: {gpu_temp:.1f}°C\n")
+                
+            except Exception as e:
+                log_lines.append(f"[{stamp}] ❌ Erro: {str(e)}\n")
+            
+            # Uma única atualização da GUI por coleta (displays e log juntos)
+            self.root.after(0, self._apply_tick, sample, log_lines)
+            
+            # Aguardar até a próxima coleta (a cada 2 segundos, sem acumular atraso)
+            next_t += MONITORING_INTERVAL
+            time.sleep(max(0, next_t - time.monotonic()))
+        
+        # Finalizar monitoramento
+        self.root.after(0, self.finish_monitoring)
+
+    def _apply_tick(self, sample, log_lines):
+        """Aplica na GUI o resultado de uma coleta do monitoramento"""
+        if log_lines:
+            self.monitoring_log.insert(tk.END, ''.join(log_lines))
+        if sample is not None:
+            self.update_realtime_display(sample)
 
     def get_cpu_temperature(self):
         """Tenta obter temperatura da CPU"""
+        if not available_libs.get('psutil') or self._temp_sensors_available is False:
+            return None
+        
+        return self._cached('cpu_temp', TEMP_CACHE_S, self._read_cpu_temperature)
+
+    def _read_cpu_temperature(self):
+        """Lê o sensor de temperatura da CPU, sem cache"""
+        # Caminho rápido no Linux: ler o arquivo do hwmon diretamente
+        if self._cpu_temp_fd is not None:
+            try:
+                return int(os.pread(self._cpu_temp_fd, 16, 0)) / 1000.0
+            except (OSError, ValueError):
+                self._close_hwmon_temp()
+        
         try:
-            if available_libs.get('psutil'):
-                sensors = psutil.sensors_temperatures()
-                if sensors:
+            sensors = psutil.sensors_temperatures()
+        except (AttributeError, NotImplementedError, OSError):
+            # Sem suporte a sensores nesta plataforma (ex.: Windows); não tentar de novo
+            self._temp_sensors_available = False
+            return None
+        
+        if self._cpu_temp_key is None:
+            # Diagnóstico e monitoramento podem chegar aqui juntos: só um detecta o sensor
+            with self._temp_lock:
+                if self._cpu_temp_key is None:
                     for name, entries in sensors.items():
-                        if 'coretemp' in name.lower() or 'cpu' in name.lower():
-                            if entries:
-                                return entries[0].current
-        except:
-            pass
+                        if entries and any(hint in name.lower() for hint in CPU_SENSOR_HINTS):
+                            break
+                    else:
+                        self._temp_sensors_available = False  # Nenhum sensor de CPU encontrado
+                        return None
+                    self._cpu_temp_fd = self._open_hwmon_temp(name)
+                    if self._cpu_temp_fd is not None:
+                        atexit.register(self._close_hwmon_temp)
+                    self._cpu_temp_key = (name, 0)
+        
+        name, index = self._cpu_temp_key
+        entries = sensors.get(name)
+        return entries[index].current if entries and len(entries) > index else None
+
+    def _open_hwmon_temp(self, sensor_name):
+        """Abre o temp1_input do hwmon com o nome informado (somente Linux)"""
+        if not sys.platform.startswith('linux'):
+            return None
+        for hwmon in Path('/sys/class/hwmon').glob('hwmon*'):
+            try:
+                if (hwmon / 'name').read_text().strip() != sensor_name:
+                    continue
+                return os.open(hwmon / 'temp1_input', os.O_RDONLY)
+            except OSError:
+                continue
         return None
 
-    def update_realtime_display(self):
-        """Atualiza os displays de métricas em tempo real"""
+    def _close_hwmon_temp(self):
+        """Fecha o descritor do sensor hwmon, se aberto"""
+        with self._temp_lock:
+            if self._cpu_temp_fd is not None:
+                os.close(self._cpu_temp_fd)
+                self._cpu_temp_fd = None
+
+    def update_realtime_display(self, sample):
+        """Atualiza os displays de métricas em tempo real com a amostra coletada"""
         try:
-            if self.monitoring_data['cpu_usage']:
-                cpu_usage = self.monitoring_data['cpu_usage'][-1]
-                self.cpu_usage_var.set(f"{cpu_usage:.1f}%")
+            if sample['cpu'] is not None:
+                self.cpu_usage_var.set(f"{sample['cpu']:.1f}%")
             
-            if self.monitoring_data['cpu_temp'] and self.monitoring_data['cpu_temp'][-1]:
-                cpu_temp = self.monitoring_data['cpu_temp'][-1]
-                self.cpu_temp_var.set(f"{cpu_temp:.1f}°C")
+            if sample['cpu_temp']:
+                self.cpu_temp_var.set(f"{sample['cpu_temp']:.1f}°C")
             
-            if self.monitoring_data['gpu_usage']:
-                gpu_usage = self.monitoring_data['gpu_usage'][-1]
-                self.gpu_usage_var.set(f"{gpu_usage:.1f}%")
+            if sample['gpu'] is not None:
+                self.gpu_usage_var.set(f"{sample['gpu']:.1f}%")
             
-            if self.monitoring_data['gpu_temp']:
-                gpu_temp = self.monitoring_data['gpu_temp'][-1]
-                self.gpu_temp_var.set(f"{gpu_temp:.1f}°C")
+            if sample['gpu_temp'] is not None:
+                self.gpu_temp_var.set(f"{sample['gpu_temp']:.1f}°C")
             
-            if self.monitoring_data['memory_usage']:
-                mem_usage = self.monitoring_data['memory_usage'][-1]
-                self.mem_usage_var.set(f"{mem_usage:.1f}%")
-                
-                # Calcular memória disponível
-                if available_libs.get('psutil'):
-                    memory = psutil.virtual_memory()
-                    self.mem_available_var.set(f"{memory.available / (1024**3):.1f} GB")
+            if sample['mem'] is not None:
+                self.mem_usage_var.set(f"{sample['mem']:.1f}%")
+                # Memória disponível lida na mesma consulta da coleta
+                self.mem_available_var.set(f"{sample['mem_livre_gb']:.1f} GB")
                     
         except Exception as e:
             pass  # Ignorar erros de atualização de display
@@ -1217,20 +1953,18 @@ class DiagnosticoPCAvancado:
         self.monitoring = False
         self.monitoring_button.config(text="▶️ Iniciar Monitoramento")
         
-        end_msg = f"\n🔴 Monitoramento finalizado: {datetime.datetime.now().strftime('%H:%M:%S')}\n"
-        end_msg += f"📊 Dados coletados: {len(self.monitoring_data['timestamps'])} amostras\n"
+        data = self.monitoring_data
+        cpu_usage, memory_usage = data['cpu_usage'], data['memory_usage']
+        parts = [f"\n🔴 Monitoramento finalizado: {datetime.datetime.now().strftime('%H:%M:%S')}\n"]
+        parts.append(f"📊 Dados coletados: {len(data['timestamps'])} amostras\n")
         
-        if self.monitoring_data['cpu_usage']:
-            avg_cpu = sum(self.monitoring_data['cpu_usage']) / len(self.monitoring_data['cpu_usage'])
-            max_cpu = max(self.monitoring_data['cpu_usage'])
-            end_msg += f"   CPU - Média: {avg_cpu:.1f}%, Máximo: {max_cpu:.1f}%\n"
+        if cpu_usage:
+            parts.append(f"   CPU - Média: {cpu_usage.mean():.1f}%, Máximo: {cpu_usage.max():.1f}%\n")
         
-        if self.monitoring_data['memory_usage']:
-            avg_mem = sum(self.monitoring_data['memory_usage']) / len(self.monitoring_data['memory_usage'])
-            max_mem = max(self.monitoring_data['memory_usage'])
-            end_msg += f"   RAM - Média: {avg_mem:.1f}%, Máximo: {max_mem:.1f}%\n"
+        if memory_usage:
+            parts.append(f"   RAM - Média: {memory_usage.mean():.1f}%, Máximo: {memory_usage.max():.1f}%\n")
         
-        self.monitoring_log.insert(tk.END, end_msg)
+        self.monitoring_log.insert(tk.END, ''.join(parts))
         
         # Salvar log de monitoramento
         self.save_monitoring_log()
@@ -1245,72 +1979,93 @@ class DiagnosticoPCAvancado:
             messagebox.showwarning("Aviso", "Nenhum dado de monitoramento disponível.\nInicie o monitoramento primeiro.")
             return
         
+        # Sem pyplot: a figura é embutida direto no Tk, evitando carregar o backend
+        # interativo e o registro global de figuras (que nunca eram fechadas)
+        Figure = _lazy('matplotlib.figure').Figure
+        FigureCanvasTkAgg = _lazy('matplotlib.backends.backend_tkagg').FigureCanvasTkAgg
+        
         # Criar janela de gráfico
         graph_window = tk.Toplevel(self.root)
         graph_window.title("📈 Gráficos de Monitoramento em Tempo Real")
         graph_window.geometry("1000x600")
         graph_window.configure(bg='#2b2b2b')
         
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
+        fig = Figure(figsize=(12, 8))
+        ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
+        
+        # Eixo X já em dias do matplotlib (hora local), sem um datetime por amostra
+        mdates = _lazy('matplotlib.dates')
+        stamps = self.monitoring_data['timestamps'].values()
+        first = stamps[0]
+        base = mdates.date2num(datetime.datetime.fromtimestamp(first))
+        times = array('d', [base + (t - first) / 86400 for t in stamps])
         fig.patch.set_facecolor('#2b2b2b')
         
         # Gráfico de CPU
-        if self.monitoring_data['cpu_usage']:
-            ax1.plot(self.monitoring_data['timestamps'], self.monitoring_data['cpu_usage'], 
+        cpu_values = self.monitoring_data['cpu_usage'].values()
+        if cpu_values:
+            ax1.plot(times[-len(cpu_values):], cpu_values, 
                     color='#ff6b6b', linewidth=2, label='CPU %')
             ax1.set_title('Uso de CPU', color='white')
             ax1.set_ylabel('Percentual (%)', color='white')
             ax1.tick_params(colors='white')
             ax1.set_facecolor('#1e1e1e')
+            ax1.xaxis_date()
             ax1.grid(True, alpha=0.3)
         
         # Gráfico de GPU
-        if self.monitoring_data['gpu_usage']:
-            ax2.plot(self.monitoring_data['timestamps'], self.monitoring_data['gpu_usage'], 
+        gpu_values = self.monitoring_data['gpu_usage'].values()
+        if gpu_values:
+            ax2.plot(times[-len(gpu_values):], gpu_values, 
                     color='#4ecdc4', linewidth=2, label='GPU %')
             ax2.set_title('Uso de GPU', color='white')
             ax2.set_ylabel('Percentual (%)', color='white')
             ax2.tick_params(colors='white')
             ax2.set_facecolor('#1e1e1e')
+            ax2.xaxis_date()
             ax2.grid(True, alpha=0.3)
         
         # Gráfico de Memória
-        if self.monitoring_data['memory_usage']:
-            ax3.plot(self.monitoring_data['timestamps'], self.monitoring_data['memory_usage'], 
+        mem_values = self.monitoring_data['memory_usage'].values()
+        if mem_values:
+            ax3.plot(times[-len(mem_values):], mem_values, 
                     color='#45b7d1', linewidth=2, label='RAM %')
             ax3.set_title('Uso de Memória RAM', color='white')
             ax3.set_ylabel('Percentual (%)', color='white')
             ax3.tick_params(colors='white')
             ax3.set_facecolor('#1e1e1e')
+            ax3.xaxis_date()
             ax3.grid(True, alpha=0.3)
         
         # Gráfico de Temperatura
         if self.monitoring_data['cpu_temp'] or self.monitoring_data['gpu_temp']:
-            if self.monitoring_data['cpu_temp']:
-                # Filtrar valores válidos de temperatura
-                valid_temps = [(t, temp) for t, temp in zip(self.monitoring_data['timestamps'], self.monitoring_data['cpu_temp']) if temp is not None]
-                if valid_temps:
-                    times, temps = zip(*valid_temps)
-                    ax4.plot(times, temps, color='#f39c12', linewidth=2, label='CPU °C')
+            # Temperaturas só são gravadas quando há sensor: alinhar às últimas amostras
+            cpu_temps = self.monitoring_data['cpu_temp'].values()
+            if cpu_temps:
+                ax4.plot(times[-len(cpu_temps):], cpu_temps,
+                        color='#f39c12', linewidth=2, label='CPU °C')
             
-            if self.monitoring_data['gpu_temp']:
-                ax4.plot(self.monitoring_data['timestamps'], self.monitoring_data['gpu_temp'], 
+            gpu_temps = self.monitoring_data['gpu_temp'].values()
+            if gpu_temps:
+                ax4.plot(times[-len(gpu_temps):], gpu_temps, 
                         color='#e74c3c', linewidth=2, label='GPU °C')
             
             ax4.set_title('Temperaturas', color='white')
             ax4.set_ylabel('Temperatura (°C)', color='white')
             ax4.tick_params(colors='white')
             ax4.set_facecolor('#1e1e1e')
+            ax4.xaxis_date()
             ax4.grid(True, alpha=0.3)
             ax4.legend()
         
         # Ajustar layout
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Integrar matplotlib com tkinter
         canvas = FigureCanvasTkAgg(fig, graph_window)
-        canvas.draw()
         canvas.get_tk_widget().pack(fill='both', expand=True)
+        # Renderizar quando o Tk estiver ocioso; pedidos repetidos viram um só desenho
+        canvas.draw_idle()
 
     def save_monitoring_csv(self):
         """Salva os dados de monitoramento em arquivo CSV"""
@@ -1322,53 +2077,62 @@ class DiagnosticoPCAvancado:
             filename = f"monitoramento_pc_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             filepath = Path.cwd() / filename
             
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            # Montar colunas já formatadas; séries mais curtas ficam alinhadas às amostras
+            # mais recentes (como no gráfico), com '' nas linhas iniciais
+            data = self.monitoring_data
+            n_rows = len(data['timestamps'])
+            
+            def column(series):
+                return itertools.chain(itertools.repeat('', n_rows - len(series)),
+                                       map(CSV_FLOAT_FMT.format, series))
+            
+            headers = ['Timestamp', 'CPU_Usage_%', 'Memory_Usage_%']
+            columns = [
+                [datetime.datetime.fromtimestamp(t).strftime('%Y-%m-%d %H:%M:%S') for t in data['timestamps']],
+                column(data['cpu_usage']),
+                column(data['memory_usage'])
+            ]
+            if data['gpu_usage']:
+                headers.append('GPU_Usage_%')
+                columns.append(column(data['gpu_usage']))
+            if data['cpu_temp']:  # Só recebe leituras válidas, basta checar o tamanho
+                headers.append('CPU_Temp_C')
+                columns.append(column(data['cpu_temp']))
+            if data['gpu_temp']:
+                headers.append('GPU_Temp_C')
+                columns.append(column(data['gpu_temp']))
+            
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER) as csvfile:
                 writer = csv.writer(csvfile)
-                
-                # Cabeçalho
-                headers = ['Timestamp', 'CPU_Usage_%', 'Memory_Usage_%']
-                if self.monitoring_data['gpu_usage']:
-                    headers.append('GPU_Usage_%')
-                if self.monitoring_data['cpu_temp'] and any(t for t in self.monitoring_data['cpu_temp'] if t):
-                    headers.append('CPU_Temp_C')
-                if self.monitoring_data['gpu_temp']:
-                    headers.append('GPU_Temp_C')
-                
                 writer.writerow(headers)
-                
-                # Dados
-                for i, timestamp in enumerate(self.monitoring_data['timestamps']):
-                    row = [
-                        timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-                        self.monitoring_data['cpu_usage'][i] if i < len(self.monitoring_data['cpu_usage']) else '',
-                        self.monitoring_data['memory_usage'][i] if i < len(self.monitoring_data['memory_usage']) else ''
-                    ]
-                    
-                    if self.monitoring_data['gpu_usage'] and i < len(self.monitoring_data['gpu_usage']):
-                        row.append(self.monitoring_data['gpu_usage'][i])
-                    elif self.monitoring_data['gpu_usage']:
-                        row.append('')
-                    
-                    if self.monitoring_data['cpu_temp'] and any(t for t in self.monitoring_data['cpu_temp'] if t):
-                        temp = self.monitoring_data['cpu_temp'][i] if i < len(self.monitoring_data['cpu_temp']) else None
-                        row.append(temp if temp is not None else '')
-                    
-                    if self.monitoring_data['gpu_temp'] and i < len(self.monitoring_data['gpu_temp']):
-                        row.append(self.monitoring_data['gpu_temp'][i])
-                    elif self.monitoring_data['gpu_temp']:
-                        row.append('')
-                    
-                    writer.writerow(row)
+                writer.writerows(zip(*columns))
             
             messagebox.showinfo("Sucesso", f"Dados salvos em: {filepath}")
             
         except Exception as e:
             messagebox.showerror("Erro", f"Erro ao salvar CSV: {str(e)}")
 
+    def _hardware_text_empty(self):
+        """Verifica se há relatório de hardware sem copiar o texto do widget"""
+        return self.hardware_text.compare('end-1c', '==', '1.0')
+
+    def _write_file_async(self, filepath, text, success_msg, error_msg):
+        """Grava um arquivo em thread separada e informa o resultado na GUI"""
+        def writer():
+            try:
+                with open(filepath, 'w', encoding='utf-8', buffering=EXPORT_BUFFER) as file:
+                    file.write(text)
+            except Exception as e:
+                self.root.after(0, messagebox.showerror, "Erro", f"{error_msg}: {str(e)}")
+            else:
+                self.root.after(0, messagebox.showinfo, "Sucesso", success_msg)
+        
+        # Sem daemon: a gravação termina mesmo se a janela for fechada logo em seguida
+        threading.Thread(target=writer).start()
+
     def export_txt_report(self):
         """Exporta relatório em formato TXT"""
-        content = self.hardware_text.get('1.0', tk.END).strip()
-        if not content:
+        if self._hardware_text_empty():
             messagebox.showwarning("Aviso", "Execute um diagnóstico primeiro.")
             return
         
@@ -1381,17 +2145,16 @@ class DiagnosticoPCAvancado:
             )
             
             if filepath:
-                with open(filepath, 'w', encoding='utf-8') as file:
-                    file.write(content)
-                messagebox.showinfo("Sucesso", f"Relatório salvo em: {filepath}")
+                content = self.hardware_text.get('1.0', 'end-1c').strip()
+                self._write_file_async(filepath, content,
+                                       f"Relatório salvo em: {filepath}", "Erro ao salvar relatório")
                 
         except Exception as e:
             messagebox.showerror("Erro", f"Erro ao salvar relatório: {str(e)}")
 
     def export_html_report(self):
         """Exporta relatório em formato HTML com gráficos"""
-        content = self.hardware_text.get('1.0', tk.END).strip()
-        if not content:
+        if self._hardware_text_empty():
             messagebox.showwarning("Aviso", "Execute um diagnóstico primeiro.")
             return
         
@@ -1404,216 +2167,89 @@ class DiagnosticoPCAvancado:
             )
             
             if filepath:
+                content = self.hardware_text.get('1.0', 'end-1c').strip()
                 html_content = self.generate_html_report(content)
-                with open(filepath, 'w', encoding='utf-8') as file:
-                    file.write(html_content)
-                messagebox.showinfo("Sucesso", f"Relatório HTML salvo em: {filepath}")
+                self._write_file_async(filepath, html_content,
+                                       f"Relatório HTML salvo em: {filepath}", "Erro ao salvar relatório HTML")
                 
         except Exception as e:
             messagebox.showerror("Erro", f"Erro ao salvar relatório HTML: {str(e)}")
 
     def generate_html_report(self, content):
         """Gera relatório em formato HTML"""
-        html = f"""
-<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Relatório de Diagnóstico de PC</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background-color: #1a1a1a;
-            color: #ffffff;
-            margin: 0;
-            padding: 20px;
-            line-height: 1.6;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: #2d2d2d;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-        }}
-        h1 {{
-            color: #00d4ff;
-            text-align: center;
-            border-bottom: 2px solid #00d4ff;
-            padding-bottom: 10px;
-        }}
-        h2 {{
-            color: #ffaa00;
-            border-left: 4px solid #ffaa00;
-            padding-left: 10px;
-            margin-top: 30px;
-        }}
-        .section {{
-            background-color: #3a3a3a;
-            padding: 20px;
-            margin: 15px 0;
-            border-radius: 8px;
-            border-left: 4px solid #00d4ff;
-        }}
-        .alert-critical {{
-            background-color: #4a1a1a;
-            border-left-color: #ff4444;
-        }}
-        .alert-warning {{
-            background-color: #4a3a1a;
-            border-left-color: #ffaa00;
-        }}
-        .alert-success {{
-            background-color: #1a4a1a;
-            border-left-color: #44ff44;
-        }}
-        pre {{
-            background-color: #1e1e1e;
-            padding: 15px;
-            border-radius: 5px;
-            overflow-x: auto;
-            font-size: 14px;
-            border: 1px solid #444;
-        }}
-        .metric-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin: 20px 0;
-        }}
-        .metric-card {{
-            background-color: #404040;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-        }}
-        .metric-value {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #00d4ff;
-        }}
-        .footer {{
-            text-align: center;
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #555;
-            color: #aaa;
-        }}
-        .timestamp {{
-            float: right;
-            color: #888;
-            font-size: 0.9em;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🔧 Relatório de Diagnóstico de PC</h1>
-        <div class="timestamp">Gerado em: {datetime.datetime.now().strftime('%d/%m/%Y às %H:%M:%S')}</div>
-        
-        <div class="section">
-            <h2>📊 Resumo Executivo</h2>
-            <div class="metric-grid">
-                <div class="metric-card">
-                    <div class="metric-value">{len(self.alerts)}</div>
-                    <div>Alertas Detectados</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{len([a for a in self.alerts if a['tipo'] == 'CRÍTICO'])}</div>
-                    <div>Alertas Críticos</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{len(self.recommendations)}</div>
-                    <div>Recomendações</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{'✅' if not any(a['tipo'] == 'CRÍTICO' for a in self.alerts) else '⚠️'}</div>
-                    <div>Status Geral</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>📋 Relatório Completo</h2>
-            <pre>{content}</pre>
-        </div>
-        
-        <div class="footer">
-            <p>Sistema de Diagnóstico de PC v1.0</p>
-            <p>Relatório gerado automaticamente</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
-        return html
+        # Contagens lidas juntas sob a trava: workers do diagnóstico podem estar registrando
+        with self._alert_lock:
+            n_total = len(self.alert_type)
+            n_critical = len(self._alerts_by_type.get('CRÍTICO', ()))
+        return HTML_REPORT_TEMPLATE.substitute(
+            gerado_em=datetime.datetime.now().strftime('%d/%m/%Y às %H:%M:%S'),
+            n_total=n_total,
+            n_critical=n_critical,
+            n_recs=len(self.recommendations),
+            status='✅' if n_critical == 0 else '⚠️',
+            content=html.escape(content, quote=False),
+        )
 
     def generate_complete_report(self):
         """Gera relatório completo com análise avançada"""
-        if not self.hardware_text.get('1.0', tk.END).strip():
+        if self._hardware_text_empty():
             messagebox.showinfo("Info", "Execute um diagnóstico completo primeiro.")
             return
+        hardware_report = self.hardware_text.get('1.0', tk.END)
         
-        report = "📊 RELATÓRIO COMPLETO DE SISTEMA\n"
-        report += "=" * 50 + "\n\n"
+        parts = ["📊 RELATÓRIO COMPLETO DE SISTEMA\n", "=" * 50 + "\n\n"]
         
         # Informações básicas
-        report += self.hardware_text.get('1.0', tk.END)
+        parts.append(hardware_report)
         
         # Adicionar dados de monitoramento se disponíveis
-        if self.monitoring_data['timestamps']:
-            report += "\n📈 DADOS DE MONITORAMENTO\n" + "-" * 30 + "\n"
-            report += f"Período: {len(self.monitoring_data['timestamps'])} amostras coletadas\n"
-            
-            if self.monitoring_data['cpu_usage']:
-                avg_cpu = sum(self.monitoring_data['cpu_usage']) / len(self.monitoring_data['cpu_usage'])
-                max_cpu = max(self.monitoring_data['cpu_usage'])
-                report += f"CPU - Média: {avg_cpu:.1f}%, Máximo: {max_cpu:.1f}%\n"
+        data = self.monitoring_data
+        if data['timestamps']:
+            parts.append("\n📈 DADOS DE MONITORAMENTO\n" + "-" * 30 + "\n")
+            parts.append(f"Período: {len(data['timestamps'])} amostras coletadas\n")
             
-            if self.monitoring_data['memory_usage']:
-                avg_mem = sum(self.monitoring_data['memory_usage']) / len(self.monitoring_data['memory_usage'])
-                max_mem = max(self.monitoring_data['memory_usage'])
-                report += f"RAM - Média: {avg_mem:.1f}%, Máximo: {max_mem:.1f}%\n"
-            
-            if self.monitoring_data['gpu_usage']:
-                avg_gpu = sum(self.monitoring_data['gpu_usage']) / len(self.monitoring_data['gpu_usage'])
-                max_gpu = max(self.monitoring_data['gpu_usage'])
-                report += f"GPU - Média: {avg_gpu:.1f}%, Máximo: {max_gpu:.1f}%\n"
+            for label, key in (('CPU', 'cpu_usage'), ('RAM', 'memory_usage'), ('GPU', 'gpu_usage')):
+                series = data[key]
+                if series:
+                    parts.append(f"{label} - Média: {series.mean():.1f}%, Máximo: {series.max():.1f}%\n")
         
+        report = ''.join(parts)
         self.reports_text.delete('1.0', tk.END)
         self.reports_text.insert('1.0', report)
 
     def open_reports_folder(self):
         """Abre a pasta de relatórios"""
         try:
-            current_dir = Path.cwd()
-            if platform.system() == 'Windows':
+            current_dir = os.getcwd()
+            sistema = _SYS_INFO['sistema']
+            # Popen: não bloquear a GUI enquanto o gerenciador de arquivos abre
+            if sistema == 'Windows':
                 os.startfile(current_dir)
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.run(['open', current_dir])
+            elif sistema == 'Darwin':  # macOS
+                subprocess.Popen(['open', current_dir])
             else:  # Linux
-                subprocess.run(['xdg-open', current_dir])
+                subprocess.Popen(['xdg-open', current_dir])
         except Exception as e:
             messagebox.showerror("Erro", f"Erro ao abrir pasta: {str(e)}")
 
     def clear_logs(self):
         """Limpa todos os logs"""
         try:
-            # Limpar logs na pasta atual
-            log_files = list(Path.cwd().glob("*.log"))
-            csv_files = list(Path.cwd().glob("monitoramento_pc_*.csv"))
-            txt_files = list(Path.cwd().glob("relatorio_pc_*.txt"))
-            html_files = list(Path.cwd().glob("relatorio_pc_*.html"))
-            
-            all_files = log_files + csv_files + txt_files + html_files
+            # Limpar logs na pasta atual (uma única leitura do diretório)
+            all_files = []
+            with os.scandir(Path.cwd()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (any(name.startswith(prefix) and name.endswith(suffix)
+                            for prefix, suffix in CLEANUP_PATTERNS)
+                            and entry.is_file()):
+                        all_files.append(entry.path)
             
             if all_files:
                 result = messagebox.askyesno("Confirmar", f"Deseja apagar {len(all_files)} arquivo(s) de log e relatórios?")
                 if result:
-                    for file in all_files:
-                        file.unlink()
+                    for path in all_files:
+                        os.unlink(path)
                     messagebox.showinfo("Sucesso", f"{len(all_files)} arquivo(s) removido(s).")
             else:
                 messagebox.showinfo("Info", "Nenhum arquivo de log encontrado.")
@@ -1624,11 +2260,10 @@ class DiagnosticoPCAvancado:
     def save_diagnosis_log(self, content):
         """Salva log do diagnóstico"""
         try:
-            log_filename = f"diagnostico_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-            with open(log_filename, 'w', encoding='utf-8') as log_file:
-                log_file.write(f"LOG DE DIAGNÓSTICO - {datetime.datetime.now()}\n")
-                log_file.write("=" * 60 + "\n")
-                log_file.write(content)
+            now = datetime.datetime.now()
+            log_filename = f"diagnostico_{now.strftime('%Y%m%d_%H%M%S')}.log"
+            with open(log_filename, 'w', encoding='utf-8', buffering=EXPORT_BUFFER) as log_file:
+                log_file.write(''.join((f"LOG DE DIAGNÓSTICO - {now}\n", "=" * 60 + "\n", content)))
         except Exception as e:
             print(f"Erro ao salvar log: {e}")
 
@@ -1637,11 +2272,19 @@ class DiagnosticoPCAvancado:
         try:
             log_content = self.monitoring_log.get('1.0', tk.END)
             if log_content.strip():
-                log_filename = f"monitoramento_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-                with open(log_filename, 'w', encoding='utf-8') as log_file:
-                    log_file.write(f"LOG DE MONITORAMENTO - {datetime.datetime.now()}\n")
-                    log_file.write("=" * 60 + "\n")
-                    log_file.write(log_content)
+                now = datetime.datetime.now()
+                log_filename = f"monitoramento_{now.strftime('%Y%m%d_%H%M%S')}.log"
+                text = ''.join((f"LOG DE MONITORAMENTO - {now}\n", "=" * 60 + "\n", log_content))
+                # Texto lido do widget na thread da GUI; só a escrita em disco sai dela
+                threading.Thread(target=self._write_monitoring_log, args=(log_filename, text)).start()
+        except Exception as e:
+            print(f"Erro ao salvar log de monitoramento: {e}")
+
+    def _write_monitoring_log(self, log_filename, text):
+        """Grava o log de monitoramento (executado fora da thread da GUI)"""
+        try:
+            with open(log_filename, 'w', encoding='utf-8', buffering=EXPORT_BUFFER) as log_file:
+                log_file.write(text)
         except Exception as e:
             print(f"Erro ao salvar log de monitoramento: {e}")
 